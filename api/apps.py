@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class APIConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        # 암호화 객체를 기동 시 1회 생성하여 요청 처리 중 키 파싱 비용 제거
+        from utils.aes_helper import get_cipher
+
+        get_cipher()
+
+        # 그룹 추가/변경/삭제 시 그룹 캐시 삭제
+        from django.contrib.auth.models import Group
+        from django.db.models.signals import post_delete, post_save
+        from utils.group_helper import clear_group_cache
+
+        post_save.connect(clear_group_cache, sender=Group, dispatch_uid="clear_group_cache_save")
+        post_delete.connect(clear_group_cache, sender=Group, dispatch_uid="clear_group_cache_delete")
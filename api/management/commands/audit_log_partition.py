@@ -0,0 +1,188 @@
+import gzip
+import json
+import logging
+import os
+from datetime import datetime
+
+from dateutil.relativedelta import relativedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from utils.format_helper import bytes_to_ip, datetime_to_str
+
+logger = logging.getLogger(__name__)
+
+EXPORT_COLUMNS = (
+    "id",
+    "user",
+    "ip",
+    "category",
+    "sub_category",
+    "action",
+    "result",
+    "object_type",
+    "object_id",
+    "changes",
+    "date",
+)
+EXPORT_BATCH_SIZE = 5000
+
+
+def get_month_start(date):
+    return date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+class Command(BaseCommand):
+    help = (
+        "audit_log 월 단위 파티션 관리 "
+        "(다음 달 파티션 생성, 보관 기간이 지난 파티션은 gzip NDJSON으로 내보낸 뒤 삭제)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--months-ahead", type=int, default=2, help="미리 생성할 파티션 개월 수")
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=settings.AUDIT_LOG_RETENTION_MONTHS,
+            help="보관 기간(월), 이전 파티션은 아카이브 후 삭제",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="실행할 작업만 출력")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "mysql":
+            raise CommandError("MySQL 파티션 테이블에서만 사용할 수 있습니다.")
+
+        partitions = self.get_partitions()
+        if not partitions:
+            raise CommandError("audit_log 테이블이 파티션으로 구성되어 있지 않습니다.")
+
+        current_month = get_month_start(datetime.now())
+        self.add_partitions(partitions, current_month, options["months_ahead"], options["dry_run"])
+
+        cutoff = current_month - relativedelta(months=options["retention_months"])
+        self.drop_partitions(partitions, cutoff, options["dry_run"])
+
+    # 파티션 목록 조회 : [(파티션 명, 상한 값 문자열)]
+    def get_partitions(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'audit_log' "
+                "AND PARTITION_NAME IS NOT NULL ORDER BY PARTITION_ORDINAL_POSITION"
+            )
+            return cursor.fetchall()
+
+    # pmax 파티션을 분할하여 앞으로 사용할 월 파티션 생성
+    def add_partitions(self, partitions, current_month, months_ahead, dry_run):
+        names = {name for name, _ in partitions}
+
+        new_partitions = []
+        for i in range(months_ahead + 1):
+            month = current_month + relativedelta(months=i)
+            name = f"p{month:%Y%m}"
+            if name in names:
+                continue
+
+            next_month = month + relativedelta(months=1)
+            new_partitions.append(
+                f"PARTITION {name} VALUES LESS THAN ('{next_month:%Y-%m-%d}')"
+            )
+
+        if not new_partitions:
+            return
+
+        sql = (
+            "ALTER TABLE audit_log REORGANIZE PARTITION pmax INTO "
+            f"({', '.join(new_partitions)}, PARTITION pmax VALUES LESS THAN (MAXVALUE))"
+        )
+        self.stdout.write(sql)
+        if not dry_run:
+            with connection.cursor() as cursor:
+                cursor.execute(sql)
+
+    # 상한 값이 보관 기준일 이전인 파티션을 아카이브 후 삭제 (DELETE 없이 즉시 제거)
+    def drop_partitions(self, partitions, cutoff, dry_run):
+        lower_bound = None
+        for name, description in partitions:
+            if name == "pmax":
+                continue
+
+            partition_lower_bound = lower_bound
+            upper_bound = lower_bound = datetime.strptime(description.strip("'")[:10], "%Y-%m-%d")
+            if upper_bound > cutoff:
+                continue
+
+            self.stdout.write(f"{name} : 아카이브 후 삭제 (상한 {description})")
+            if dry_run:
+                continue
+
+            archive_path, count = self.export_partition(name)
+            self.stdout.write(f"{name} : {count}건 → {archive_path}")
+
+            with connection.cursor() as cursor:
+                cursor.execute(f"SELECT COUNT(*) FROM audit_log PARTITION ({name})")
+                if cursor.fetchone()[0] != count:
+                    # 아카이브 이후 추가된 데이터가 있으면 삭제하지 않고 다음 실행 시 재처리
+                    logger.warning(f"[audit_log_partition] {name} : 아카이브 건수 불일치로 삭제 보류")
+                    continue
+
+                cursor.execute(f"ALTER TABLE audit_log DROP PARTITION {name}")
+
+            self.delete_search_rows(partition_lower_bound, upper_bound)
+
+    # 삭제된 파티션 기간의 전문 검색 사본 삭제 (파티션 삭제 시 트리거가 동작하지 않으므로 직접 삭제)
+    def delete_search_rows(self, lower_bound, upper_bound):
+        where = "date < %s"
+        params = [upper_bound]
+        if lower_bound is not None:
+            where += " AND date >= %s"
+            params.append(lower_bound)
+
+        while True:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"DELETE FROM audit_log_search WHERE {where} LIMIT %s",
+                    [*params, EXPORT_BATCH_SIZE],
+                )
+                if cursor.rowcount < EXPORT_BATCH_SIZE:
+                    break
+
+    # 파티션 데이터를 아이디 순으로 나누어 읽으며 gzip NDJSON 파일로 저장
+    def export_partition(self, name):
+        archive_dir = settings.AUDIT_LOG_ARCHIVE_DIR
+        os.makedirs(archive_dir, exist_ok=True)
+
+        archive_path = os.path.join(archive_dir, f"audit_log_{name[1:]}.ndjson.gz")
+        temp_path = f"{archive_path}.tmp"
+
+        count = 0
+        last_id = 0
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            while True:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"SELECT {', '.join(f'`{column}`' for column in EXPORT_COLUMNS)} "
+                        f"FROM audit_log PARTITION ({name}) WHERE id > %s ORDER BY id LIMIT %s",
+                        [last_id, EXPORT_BATCH_SIZE],
+                    )
+                    rows = cursor.fetchall()
+
+                if not rows:
+                    break
+
+                for row in rows:
+                    data = dict(zip(EXPORT_COLUMNS, row))
+                    data["ip"] = bytes_to_ip(data["ip"]) if data["ip"] else None
+                    data["date"] = datetime_to_str(data["date"], "%Y-%m-%d %H:%M:%S")
+                    if isinstance(data["changes"], str):
+                        data["changes"] = json.loads(data["changes"])
+                    f.write(json.dumps(data, ensure_ascii=False) + "\n")
+
+                count += len(rows)
+                last_id = rows[-1][0]
+
+        # 아카이브 파일이 완성된 이후에만 파티션을 삭제하도록 이름 변경으로 확정
+        os.replace(temp_path, archive_path)
+
+        return archive_path, count
@@ -0,0 +1,49 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from api.models import ENCRYPTED_FIELDS
+from utils.aes_helper import decrypt_many, make_blind_index
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "암호화 필드의 블라인드 인덱스를 기본 키 순서로 일괄 생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="배치 당 처리 건수")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        for model, field_pairs in ENCRYPTED_FIELDS.items():
+            field_pairs = [(enc_field, bidx_field) for enc_field, bidx_field in field_pairs if bidx_field]
+            if not field_pairs:
+                continue
+
+            enc_fields = [enc_field for enc_field, _ in field_pairs]
+            bidx_fields = [bidx_field for _, bidx_field in field_pairs]
+
+            total = 0
+            last_id = 0
+            while True:
+                rows = list(
+                    model.objects.filter(id__gt=last_id)
+                    .order_by("id")
+                    .only("id", *enc_fields)[:batch_size]
+                )
+                if not rows:
+                    break
+
+                for enc_field, bidx_field in field_pairs:
+                    dec_values = decrypt_many([getattr(row, enc_field) for row in rows])
+                    for row, dec_value in zip(rows, dec_values):
+                        setattr(row, bidx_field, make_blind_index(dec_value))
+
+                model.objects.bulk_update(rows, bidx_fields)
+
+                total += len(rows)
+                last_id = rows[-1].id
+
+            self.stdout.write(f"{model._meta.db_table} : {total}건 처리 완료")
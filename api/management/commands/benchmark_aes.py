@@ -0,0 +1,107 @@
+import logging
+import random
+import timeit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.aes_helper import AESCipher, decrypt_many, encrypt_many, get_cipher, get_dec_value, make_enc_value
+
+logger = logging.getLogger(__name__)
+
+# 측정용 값 생성 문자 (계좌번호, 시리얼 값 등 짧은 값)
+SHORT_VALUE_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ-"
+
+# 측정용 노트 생성 단어 및 길이(글자 수) : 짧은 메모부터 긴 문서까지 섞어서 생성
+NOTE_WORDS = (
+    "오늘 회의 내용 정리 프로젝트 일정 확인 필요 고객 요청 사항 반영 다음 주 배포 예정 테스트 결과 "
+    "서버 점검 데이터베이스 백업 완료 문제 발생 원인 분석 중 담당자 연락 처리 회의록 작성 공유 "
+    "이번 달 지출 내역 식비 교통비 관리비 카드 결제 계좌 이체 메모 장보기 병원 예약 "
+    "월요일 화요일 수요일 목요일 금요일 주말 여행 계획 숙소 비행기 예매 가족 모임 생일 선물"
+).split()
+NOTE_LENGTHS = (80, 300, 1000, 3000, 10000)
+
+
+class Command(BaseCommand):
+    help = (
+        "암호화 필드 암복호화 시간 측정 (DB 사용 없음) "
+        "호출마다 AESCipher 생성 / 프로세스 공유 AESCipher / 일괄 처리(encrypt_many, decrypt_many)의 값 당 처리 시간 및 "
+        "노트 본문의 기존 형식 / 봉투 형식(압축) 암호문 크기와 처리 시간 출력"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--values", type=int, default=200, help="측정할 값 개수")
+        parser.add_argument("--number", type=int, default=50, help="반복 측정 1회 당 실행 횟수")
+        parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최솟값 출력)")
+        parser.add_argument("--seed", type=int, default=1, help="측정용 값 생성 난수 시드")
+
+    def handle(self, *args, **options):
+        rand = random.Random(options["seed"])
+        values = [
+            "".join(rand.choice(SHORT_VALUE_CHARS) for _ in range(rand.randint(10, 40)))
+            for _ in range(options["values"])
+        ]
+
+        notes = [self.make_note(rand, rand.choice(NOTE_LENGTHS)) for _ in range(options["values"])]
+
+        self.benchmark_cipher(values, options)
+        self.benchmark_envelope(notes, options)
+
+    def make_note(self, rand, length):
+        lines = []
+        while sum(len(line) + 1 for line in lines) < length:
+            lines.append(" ".join(rand.choice(NOTE_WORDS) for _ in range(rand.randint(4, 12))))
+
+        return "\n".join(lines)
+
+    # 호출마다 AESCipher 생성 (설정 조회, 키/IV hex 변환) 대비 공유 AESCipher 및 일괄 처리 비교
+    def benchmark_cipher(self, values, options):
+        enc_values = encrypt_many(values)
+        if decrypt_many(enc_values) != values:
+            raise CommandError("복호화 결과가 원문과 다릅니다.")
+
+        def new_cipher():
+            return AESCipher(getattr(settings, "AES_KEY"), getattr(settings, "AES_KEY_IV"))
+
+        cases = (
+            ("암호화 : 호출마다 AESCipher 생성", lambda: [new_cipher().encrypt(value) for value in values]),
+            ("암호화 : 공유 AESCipher (make_enc_value)", lambda: [make_enc_value(value) for value in values]),
+            ("암호화 : 일괄 (encrypt_many)", lambda: encrypt_many(values)),
+            ("복호화 : 호출마다 AESCipher 생성", lambda: [new_cipher().decrypt(enc_value) for enc_value in enc_values]),
+            ("복호화 : 공유 AESCipher (get_dec_value)", lambda: [get_dec_value(enc_value) for enc_value in enc_values]),
+            ("복호화 : 일괄 (decrypt_many)", lambda: decrypt_many(enc_values)),
+        )
+
+        self.stdout.write(f"[AESCipher] 값 {len(values)}개")
+        for description, func in cases:
+            self.stdout.write(f"{description} : {self.measure(func, len(values), options):.1f}us/값")
+
+    # 기존 형식(압축 없음) 대비 봉투 형식(압축 효과가 있는 긴 값만 압축 후 암호화) 암호문 크기 및 처리 시간 비교
+    def benchmark_envelope(self, notes, options):
+        aes = get_cipher()
+
+        legacy_values = [aes.encrypt(note) for note in notes]
+        envelope_values = [aes.seal(note) for note in notes]
+        if [aes.unseal(enc_value) for enc_value in envelope_values] != notes:
+            raise CommandError("복호화 결과가 원문과 다릅니다.")
+
+        plain_size = sum(len(note.encode()) for note in notes)
+        legacy_size = sum(len(enc_value) for enc_value in legacy_values)
+        envelope_size = sum(len(enc_value) for enc_value in envelope_values)
+
+        self.stdout.write(f"[봉투 형식] 노트 {len(notes)}개, 평문 {plain_size}B")
+        self.stdout.write(f"암호문 크기 : 기존 형식 {legacy_size}B ({legacy_size / plain_size:.2f}배), 봉투 형식 {envelope_size}B ({envelope_size / plain_size:.2f}배)")
+
+        cases = (
+            ("암호화 : 기존 형식", lambda: [aes.encrypt(note) for note in notes]),
+            ("암호화 : 봉투 형식", lambda: [aes.seal(note) for note in notes]),
+            ("복호화 : 기존 형식", lambda: [aes.decrypt(enc_value) for enc_value in legacy_values]),
+            ("복호화 : 봉투 형식", lambda: [aes.unseal(enc_value) for enc_value in envelope_values]),
+        )
+        for description, func in cases:
+            self.stdout.write(f"{description} : {self.measure(func, len(notes), options):.1f}us/값")
+
+    # 값 당 처리 시간(마이크로초) : 반복 측정 중 최솟값 기준
+    def measure(self, func, count, options):
+        timings = timeit.repeat(func, number=options["number"], repeat=options["repeat"])
+        return min(timings) / options["number"] / count * 1e6
@@ -0,0 +1,170 @@
+import logging
+import statistics
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from api.models import BankAccount, GuestBook, Note, Serial
+from api.views.bank_account import BankAccountFilter
+from api.views.guest_book import GuestBookFilter
+from api.views.note import NoteFilter
+from api.views.serial import SerialFilter
+from utils.aes_helper import make_enc_value
+
+logger = logging.getLogger(__name__)
+
+SEED_BATCH_SIZE = 5000
+
+# 측정할 목록 조회 조건 : (모델, 필터 클래스, [(설명, 파라미터)])
+PAGE_CASES = (
+    (Note, NoteFilter, (
+        ("아이디", {"ordering": "-id"}),
+        ("제목", {"ordering": "title"}),
+        ("작성 일시", {"ordering": "-date"}),
+        ("기간 + 작성 일시", {"start_date": "2024-03-01", "end_date": "2024-03-31", "ordering": "-date"}),
+    )),
+    (GuestBook, GuestBookFilter, (
+        ("아이디", {"ordering": "-id"}),
+        ("이름", {"ordering": "name"}),
+        ("금액", {"ordering": "-amount"}),
+        ("지역", {"ordering": "area"}),
+        ("기간 + 날짜", {"start_date": "2024-03-01", "end_date": "2024-03-31", "ordering": "date"}),
+    )),
+    (Serial, SerialFilter, (
+        ("아이디", {"ordering": "-id"}),
+        ("종류", {"ordering": "type"}),
+        ("제목", {"ordering": "title"}),
+    )),
+    (BankAccount, BankAccountFilter, (
+        ("아이디", {"ordering": "-id"}),
+        ("은행", {"ordering": "bank"}),
+        ("예금주", {"ordering": "account_holder"}),
+    )),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "사용자 별 목록 조회(정렬, 기간 검색) 페이지 응답 시간 측정 "
+        "벤치마크 사용자에 모델 별 데이터를 생성한 뒤 조건 별 첫 페이지 / 중간 페이지 조회 시간과 정렬 방식(인덱스, filesort) 출력 "
+        "(인덱스 마이그레이션 적용 전후로 실행하여 비교, 종료 시 생성한 데이터 삭제)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100000, help="모델 별 생성할 데이터 건수")
+        parser.add_argument("--page-size", type=int, default=10, help="페이지 크기")
+        parser.add_argument("--repeat", type=int, default=5, help="조건 별 반복 측정 횟수 (중앙값 출력)")
+        parser.add_argument("--keep", action="store_true", help="생성한 벤치마크 사용자 및 데이터를 삭제하지 않음")
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ("mysql", "sqlite"):
+            raise CommandError(f"지원하지 않는 DB 입니다. ({connection.vendor})")
+
+        user = User.objects.create_user(f"benchmark_{uuid.uuid4().hex[:8]}", is_active=False)
+        try:
+            self.seed(user, options["rows"])
+
+            for model, filter_class, cases in PAGE_CASES:
+                for description, params in cases:
+                    queryset = filter_class(data=params, queryset=model.objects.filter(user=user)).qs
+                    self.measure(model, description, params, queryset, options)
+
+        finally:
+            if options["keep"]:
+                self.stdout.write(f"벤치마크 사용자 유지 : {user.username}")
+            else:
+                self.cleanup(user)
+
+    # 모델 별 벤치마크 데이터 생성 (정렬 필드 값은 분산되도록 생성, 암호화 필드는 같은 암호문 사용)
+    def seed(self, user, rows):
+        enc_value = make_enc_value("benchmark")
+        start_date = datetime(2024, 1, 1)
+
+        factories = (
+            (Note, lambda i: Note(
+                title=f"제목 {(i * 7919) % rows:08d}",
+                note=enc_value,
+                date=start_date + timedelta(minutes=i),
+                user=user,
+            )),
+            (GuestBook, lambda i: GuestBook(
+                name=f"이름{(i * 7919) % rows:06d}"[:16],
+                amount=(i * 7919) % 1000 * 1000,
+                date=date(2024, 1, 1) + timedelta(days=i % 365),
+                area=f"지역{i % 50:02d}",
+                attend="Y",
+                user=user,
+            )),
+            (Serial, lambda i: Serial(
+                type=f"t{i % 20:02d}",
+                title=f"제목 {(i * 7919) % rows:08d}",
+                value=enc_value,
+                user=user,
+            )),
+            (BankAccount, lambda i: BankAccount(
+                bank=f"은행{i % 30:02d}",
+                account=f"{user.username}-{i}",
+                account_holder=f"예금주{(i * 7919) % rows:08d}",
+                user=user,
+            )),
+        )
+
+        for model, factory in factories:
+            started = time.perf_counter()
+            for start in range(0, rows, SEED_BATCH_SIZE):
+                with transaction.atomic():
+                    model.objects.bulk_create(
+                        [factory(i) for i in range(start, min(start + SEED_BATCH_SIZE, rows))],
+                        batch_size=SEED_BATCH_SIZE,
+                    )
+            self.stdout.write(f"{model._meta.db_table} : {rows}건 생성 ({time.perf_counter() - started:.1f}초)")
+
+        if connection.vendor == "mysql":
+            with connection.cursor() as cursor:
+                for model, _ in factories:
+                    cursor.execute(f"ANALYZE TABLE {model._meta.db_table}")
+                    cursor.fetchall()
+
+    def measure(self, model, description, params, queryset, options):
+        page_size = options["page_size"]
+        middle_offset = queryset.count() // 2 // page_size * page_size
+
+        results = []
+        for name, offset in (("첫 페이지", 0), ("중간 페이지", middle_offset)):
+            timings = []
+            for _ in range(options["repeat"]):
+                started = time.perf_counter()
+                # 결과 캐시를 사용하지 않도록 매번 새 쿼리셋으로 조회
+                list(queryset.all()[offset:offset + page_size])
+                timings.append((time.perf_counter() - started) * 1000)
+
+            results.append(f"{name} {statistics.median(timings):.2f}ms")
+
+        self.stdout.write(
+            f"[{model._meta.db_table}] {description} {params} : {', '.join(results)} / {self.explain(queryset[:page_size])}"
+        )
+
+    # 실행 계획 요약 (정렬에 사용한 인덱스 또는 filesort 여부)
+    def explain(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+
+        with connection.cursor() as cursor:
+            if connection.vendor == "mysql":
+                cursor.execute(f"EXPLAIN {sql}", params)
+                columns = [col[0] for col in cursor.description]
+                rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+                return ", ".join(f"key={row['key']} rows={row['rows']} extra={row['Extra'] or '-'}" for row in rows)
+
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return ", ".join(row[-1] for row in cursor.fetchall())
+
+    # 벤치마크 데이터 삭제 (연관 객체가 없는 모델은 DELETE 1회로 삭제)
+    def cleanup(self, user):
+        for model in (Note, GuestBook, Serial, BankAccount):
+            model.objects.filter(user=user).delete()
+        user.delete()
@@ -0,0 +1,84 @@
+import logging
+
+from django.core.exceptions import EmptyResultSet
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from api.views.audit_log import AuditLogAPI, AuditLogFilter, AuditLogPagination
+
+logger = logging.getLogger(__name__)
+
+# 점검할 AuditLogFilter 검색 조건 : (설명, 파라미터, 점검 대상 DB, 정렬 허용 여부)
+# SQLite의 LIKE는 대소문자를 구분하지 않아 인덱스를 사용하지 않으므로 사용자 검색은 MySQL에서만 점검
+# 범위 검색(사용자 앞부분 일치, IP 대역)과 관련도 순 정렬(내용 전문 검색)은 인덱스 순서와 목록 정렬(date, id)이 달라 정렬 허용
+FILTER_CASES = (
+    ("기간", {"start_date": "2024-01-01 00:00:00", "end_date": "2024-02-01 00:00:00"}, ("mysql", "sqlite"), False),
+    ("사용자", {"user": "admin"}, ("mysql",), True),
+    ("사용자 + 기간", {"user": "admin", "start_date": "2024-01-01 00:00:00", "end_date": "2024-02-01 00:00:00"}, ("mysql",), True),
+    ("IP", {"ip": "192.168.0.1"}, ("mysql", "sqlite"), False),
+    ("IP 대역", {"ip": "192.168.0.0/24"}, ("mysql", "sqlite"), True),
+    ("IPv6 대역", {"ip": "2001:db8::/32"}, ("mysql", "sqlite"), True),
+    ("카테고리", {"category": "노트 관리"}, ("mysql", "sqlite"), False),
+    ("카테고리 + 하위 카테고리", {"category": "계정 관리", "sub_category": "사용자 관리"}, ("mysql", "sqlite"), False),
+    ("대상 객체", {"object_type": "note", "object_id": "42"}, ("mysql", "sqlite"), False),
+    ("내용 전문 검색", {"q": "편집"}, ("mysql", "sqlite"), True),
+    ("결과 + 기간", {"result": "실패", "start_date": "2024-01-01 00:00:00", "end_date": "2024-02-01 00:00:00"}, ("mysql", "sqlite"), False),
+)
+
+class Command(BaseCommand):
+    help = "AuditLogFilter 검색 조건 별 목록 첫 페이지 조회의 실행 계획(EXPLAIN)을 확인하여 전체 테이블 스캔 또는 허용하지 않은 정렬(filesort, 임시 B-TREE)이 발생하면 실패 처리"
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ("mysql", "sqlite"):
+            raise CommandError(f"지원하지 않는 DB 입니다. ({connection.vendor})")
+
+        failures = []
+        for description, params, vendors, allow_sort in FILTER_CASES:
+            if connection.vendor not in vendors:
+                continue
+
+            queryset = self.get_page_queryset(AuditLogFilter(data=params, queryset=AuditLogAPI.queryset).qs)
+            plan, full_scan, sort = self.explain(queryset)
+
+            failed = full_scan or (sort and not allow_sort)
+            self.stdout.write(f"[{'FAIL' if failed else 'SORT' if sort else 'OK'}] {description} {params} : {plan}")
+            if failed:
+                failures.append(description)
+
+        if failures:
+            raise CommandError(f"전체 테이블 스캔 또는 정렬 발생 : {', '.join(failures)}")
+
+    # 목록 API 와 같은 정렬 및 건수로 첫 페이지 조회 쿼리셋 생성
+    def get_page_queryset(self, queryset):
+        paginator = AuditLogPagination()
+        paginator.field_name, descending = paginator.get_ordering(queryset)
+
+        return queryset.order_by(*paginator.get_order_by(descending))[:paginator.page_size + 1]
+
+    # (실행 계획 요약, 전체 테이블 스캔 여부, 정렬 발생 여부) 반환
+    def explain(self, queryset):
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            # 조건상 결과가 없어 쿼리를 실행하지 않는 경우
+            return "EMPTY", False, False
+
+        with connection.cursor() as cursor:
+            if connection.vendor == "mysql":
+                cursor.execute(f"EXPLAIN {sql}", params)
+                columns = [col[0] for col in cursor.description]
+                rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+                plan = ", ".join(f"type={row['type']} key={row['key']} extra={row['Extra']}" for row in rows)
+                full_scan = any(row["type"] == "ALL" for row in rows)
+                sort = any("Using filesort" in (row["Extra"] or "") or "Using temporary" in (row["Extra"] or "") for row in rows)
+
+            else:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                details = [row[-1] for row in cursor.fetchall()]
+
+                plan = ", ".join(details)
+                full_scan = any(detail.startswith("SCAN ") for detail in details)
+                sort = any(detail.startswith("USE TEMP B-TREE") for detail in details)
+
+        return plan, full_scan, sort
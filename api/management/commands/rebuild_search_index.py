@@ -0,0 +1,52 @@
+import logging
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.models import SEARCH_FIELDS, SearchToken
+from utils.aes_helper import decrypt_many
+from utils.search_helper import build_search_tokens, get_search_target
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "암호화 필드 부분 일치 검색용 n-gram 토큰 역색인을 기본 키 순서로 재생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200, help="배치 당 처리 건수")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        for model, fields in SEARCH_FIELDS.items():
+            targets = [get_search_target(model, field) for field in fields]
+
+            total = 0
+            last_id = 0
+            while True:
+                rows = list(
+                    model.objects.filter(id__gt=last_id)
+                    .order_by("id")
+                    .only("id", "user_id", *fields)[:batch_size]
+                )
+                if not rows:
+                    break
+
+                search_tokens = []
+                for field in fields:
+                    dec_values = decrypt_many([getattr(row, field) for row in rows])
+                    for row, dec_value in zip(rows, dec_values):
+                        if row.user_id:
+                            search_tokens.extend(build_search_tokens(row, field, dec_value))
+
+                with transaction.atomic():
+                    SearchToken.objects.filter(
+                        target__in=targets, object_id__in=[row.id for row in rows]
+                    ).delete()
+                    SearchToken.objects.bulk_create(search_tokens, batch_size=1000)
+
+                total += len(rows)
+                last_id = rows[-1].id
+
+            self.stdout.write(f"{model._meta.db_table} : {total}건 처리 완료")
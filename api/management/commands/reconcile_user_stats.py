@@ -0,0 +1,60 @@
+import logging
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from api.models import USER_STAT_FIELDS, UserStat
+from utils.stat_helper import count_user_stat, create_user_stat
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "사용자 별 항목 건수(user_stats) 보정 "
+        "사용자 별 실제 건수를 집계하여 통계와 다른 사용자만 다시 계산 (CRONJOBS 매일 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="보정 대상 사용자만 출력")
+
+    def handle(self, *args, **options):
+        fields = list(USER_STAT_FIELDS.values())
+
+        # 실제 건수 : {사용자 아이디: {건수 필드: 건수}}
+        counts = {}
+        for model, field in USER_STAT_FIELDS.items():
+            rows = model.objects.filter(user__isnull=False).values("user").annotate(count=Count("id")).order_by()
+            for row in rows:
+                counts.setdefault(row["user"], {})[field] = row["count"]
+
+        stats = {
+            user_stat.user_id: {field: getattr(user_stat, field) for field in fields}
+            for user_stat in UserStat.objects.all()
+        }
+
+        user_ids = sorted(
+            user_id
+            for user_id in counts.keys() | stats.keys()
+            if stats.get(user_id) != {field: counts.get(user_id, {}).get(field, 0) for field in fields}
+        )
+
+        for user_id in user_ids:
+            self.stdout.write(f"{user_id} : {stats.get(user_id)} → {counts.get(user_id, {})}")
+            if options["dry_run"]:
+                continue
+
+            with transaction.atomic():
+                # 통계 행을 잠근 뒤 다시 계산하므로 집계 이후 추가/삭제된 항목도 반영
+                # (잠금 대기 중 커밋된 증감은 재계산에 포함되고, 이후의 증감은 잠금 해제 후 적용)
+                user_stat = UserStat.objects.select_for_update().filter(user_id=user_id).first()
+                if user_stat is None:
+                    create_user_stat(user_id)
+                    continue
+
+                for field, count in count_user_stat(user_id).items():
+                    setattr(user_stat, field, count)
+                user_stat.save(update_fields=[*fields, "updated_at"])
+
+        self.stdout.write(f"{len(user_ids)}명 보정" if not options["dry_run"] else f"{len(user_ids)}명 보정 대상")
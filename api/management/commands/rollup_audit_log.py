@@ -0,0 +1,103 @@
+import logging
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Max
+from django.db.models.functions import TruncDate
+
+from api.models import AuditLog, AuditLogStat, AuditLogStatState
+
+logger = logging.getLogger(__name__)
+
+STATE_NAME = "audit_log"
+STAT_KEY_FIELDS = ("day", "category", "sub_category", "result", "user")
+
+
+class Command(BaseCommand):
+    help = (
+        "감사 로그 일 단위 증분 집계 (audit_log_stat) "
+        "이전 실행 시점의 최대 아이디까지 아이디 구간 별로 집계하여 누적 (CRONJOBS 주기 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50000, help="배치 당 집계할 아이디 구간 크기")
+        parser.add_argument("--reset", action="store_true", help="집계 데이터를 삭제하고 처음부터 다시 집계")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        if options["reset"]:
+            with transaction.atomic():
+                AuditLogStat.objects.all().delete()
+                AuditLogStatState.objects.filter(name=STATE_NAME).delete()
+
+        state, _ = AuditLogStatState.objects.get_or_create(name=STATE_NAME)
+        last_id = state.last_id
+        target_id = state.pending_id
+
+        aggregated = 0
+        while last_id < target_id:
+            end_id = min(last_id + batch_size, target_id)
+
+            with transaction.atomic():
+                # 동시에 실행된 경우 먼저 잠금을 획득한 실행만 집계
+                state = AuditLogStatState.objects.select_for_update().get(name=STATE_NAME)
+                if state.last_id != last_id:
+                    self.stdout.write("다른 실행에서 집계 중이므로 종료")
+                    return
+
+                rows = list(
+                    AuditLog.objects.filter(id__gt=last_id, id__lte=end_id)
+                    .annotate(day=TruncDate("date"))
+                    .values(*STAT_KEY_FIELDS)
+                    .annotate(count=Count("id"))
+                    .order_by()
+                )
+                self.merge_stats(rows)
+
+                state.last_id = end_id
+                state.save(update_fields=["last_id", "updated_at"])
+
+            aggregated += sum(row["count"] for row in rows)
+            last_id = end_id
+
+        # 현재 최대 아이디는 실행 중인 트랜잭션이 커밋될 수 있도록 다음 실행에서 집계
+        max_id = AuditLog.objects.aggregate(max_id=Max("id"))["max_id"] or 0
+        AuditLogStatState.objects.filter(name=STATE_NAME).update(pending_id=max(max_id, last_id))
+
+        self.stdout.write(f"{aggregated}건 집계 (마지막 아이디 : {last_id}, 다음 집계 대상 : {max_id})")
+
+    # 집계 결과를 기존 일 단위 건수에 누적 (없는 항목은 추가)
+    def merge_stats(self, rows):
+        if not rows:
+            return
+
+        counts = {}
+        for row in rows:
+            key = (
+                row["day"],
+                row["category"] or "",
+                row["sub_category"] or "",
+                row["result"],
+                row["user"] or "",
+            )
+            counts[key] = counts.get(key, 0) + row["count"]
+
+        days = {key[0] for key in counts}
+        existing = {
+            (stat.day, stat.category, stat.sub_category, stat.result, stat.user): stat
+            for stat in AuditLogStat.objects.select_for_update().filter(day__in=days)
+        }
+
+        update_stats = []
+        create_stats = []
+        for key, count in counts.items():
+            stat = existing.get(key)
+            if stat is not None:
+                stat.count += count
+                update_stats.append(stat)
+            else:
+                create_stats.append(AuditLogStat(**dict(zip(STAT_KEY_FIELDS, key)), count=count))
+
+        AuditLogStat.objects.bulk_update(update_stats, ["count"], batch_size=500)
+        AuditLogStat.objects.bulk_create(create_stats, batch_size=500)
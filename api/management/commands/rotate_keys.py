@@ -0,0 +1,133 @@
+import json
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.models import ENCRYPTED_FIELDS
+from utils.aes_helper import (
+    decrypt_many,
+    encrypt_many,
+    get_current_key_version,
+    get_key_version,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "암호화 필드를 현재 키(AES_KEY_VERSION)로 재암호화 (기본 키 순서로 배치 처리, 중단 시 체크포인트부터 재개)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="배치 당 처리 건수")
+        parser.add_argument("--sleep", type=float, default=0.0, help="배치 사이 대기 시간(초)")
+        parser.add_argument(
+            "--checkpoint",
+            default=str(settings.LOGDIR / "rotate_keys.checkpoint.json"),
+            help="체크포인트 파일 경로",
+        )
+        parser.add_argument("--reset", action="store_true", help="체크포인트를 무시하고 처음부터 수행")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        sleep = options["sleep"]
+        checkpoint_path = options["checkpoint"]
+
+        checkpoint = {} if options["reset"] else self.load_checkpoint(checkpoint_path)
+        current_version = get_current_key_version()
+
+        self.stdout.write(f"현재 키 버전 : {current_version}")
+
+        for model, field_pairs in ENCRYPTED_FIELDS.items():
+            table = model._meta.db_table
+            enc_fields = [enc_field for enc_field, _ in field_pairs]
+
+            last_id = checkpoint.get(table, 0)
+            scanned = 0
+            updated = 0
+            failed = 0
+            started_at = time.monotonic()
+
+            while True:
+                # 재암호화 중 사용자 수정 내용을 덮어쓰지 않도록 배치 단위로 잠금
+                with transaction.atomic():
+                    rows = list(
+                        model.objects.select_for_update()
+                        .filter(id__gt=last_id)
+                        .order_by("id")
+                        .only("id", *enc_fields)[:batch_size]
+                        .iterator()
+                    )
+                    if not rows:
+                        break
+
+                    changed_rows = {}
+                    for enc_field in enc_fields:
+                        targets = [
+                            row
+                            for row in rows
+                            if self.needs_rotation(getattr(row, enc_field), current_version)
+                        ]
+                        dec_values = decrypt_many([getattr(row, enc_field) for row in targets])
+                        enc_values = encrypt_many(dec_values)
+
+                        for row, dec_value, enc_value in zip(targets, dec_values, enc_values):
+                            # 복호화 / 암호화 실패 시 재암호화하지 않고 기존 값 유지
+                            if dec_value is None or enc_value is None:
+                                logger.warning(
+                                    f"[rotate_keys] {table}.{enc_field} 재암호화 실패 (아이디 {row.id})"
+                                )
+                                failed += 1
+                                continue
+
+                            setattr(row, enc_field, enc_value)
+                            changed_rows[row.id] = row
+
+                    if changed_rows:
+                        model.objects.bulk_update(changed_rows.values(), enc_fields)
+
+                scanned += len(rows)
+                updated += len(changed_rows)
+                last_id = rows[-1].id
+
+                checkpoint[table] = last_id
+                self.save_checkpoint(checkpoint_path, checkpoint)
+
+                elapsed = time.monotonic() - started_at
+                self.stdout.write(
+                    f"{table} : {scanned}건 조회, {updated}건 재암호화, {failed}건 실패 "
+                    f"(마지막 아이디 {last_id}, {scanned / elapsed if elapsed else 0:.0f}건/초)"
+                )
+
+                if sleep:
+                    time.sleep(sleep)
+
+            self.stdout.write(f"{table} : 완료 ({scanned}건 조회, {updated}건 재암호화, {failed}건 실패)")
+
+        # 전체 완료 시 다음 키 교체를 위해 체크포인트 초기화
+        self.save_checkpoint(checkpoint_path, {})
+
+    # 현재 키 버전이 아닌 암호문 여부 (키 버전을 해석할 수 없는 값은 복호화 단계에서 실패 처리되도록 대상에 포함)
+    def needs_rotation(self, enc_value, current_version):
+        if not enc_value:
+            return False
+
+        try:
+            return get_key_version(enc_value) != current_version
+
+        except ValueError:
+            return True
+
+    def load_checkpoint(self, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+
+        except FileNotFoundError:
+            return {}
+
+    def save_checkpoint(self, path, checkpoint):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
@@ -0,0 +1,28 @@
+import logging
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.lotto_helper import refresh_lotto_stats, save_lotto_stats_file
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "로또 번호 별 당첨 횟수 통계를 원격에서 조회하여 통계 파일(LOTTO_STATS_FILE) 및 캐시 갱신 "
+        "(네트워크가 없는 환경에서는 생성한 통계 파일을 복사하여 LOTTO_STATS_OFFLINE=True 로 사용)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=None, help="통계 파일 경로 (기본 : LOTTO_STATS_FILE)")
+
+    def handle(self, *args, **options):
+        stats = refresh_lotto_stats()
+        if stats is None:
+            raise CommandError("번호 별 통계를 조회하지 못했습니다.")
+
+        output = options["output"] or settings.LOTTO_STATS_FILE
+        save_lotto_stats_file(stats, output)
+
+        self.stdout.write(f"{len(stats)}개 번호 통계 저장 → {output}")
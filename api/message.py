@@ -3,3 +3,6 @@ duplicated = "중복된 데이터가 존재합니다."
 invalid_permission_field = "'사용자' 또는 '관리자'만 입력 가능합니다."
 not_found = "데이터를 찾을 수 없습니다."
 invalid_field = "이 필드의 형식이 잘못되었습니다."
+search_keyword_too_short = "2글자 이상인 단어를 1개 이상 입력해야 합니다."
+decrypt_failed = "데이터를 복호화할 수 없습니다."
+lotto_stats_unavailable = "번호 별 통계를 조회할 수 없습니다. 잠시 후 다시 시도해 주세요."
@@ -0,0 +1,60 @@
+# Generated by Django 5.1.4 on 2026-10-18 19:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bankaccount',
+            name='account_bidx',
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='bankaccount',
+            name='description_bidx',
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='note_bidx',
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='serial',
+            name='description_bidx',
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='serial',
+            name='value_bidx',
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='bankaccount',
+            index=models.Index(fields=['user', 'account_bidx'], name='bank_account_account_bidx'),
+        ),
+        migrations.AddIndex(
+            model_name='bankaccount',
+            index=models.Index(fields=['user', 'description_bidx'], name='bank_account_desc_bidx'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['user', 'note_bidx'], name='note_note_bidx'),
+        ),
+        migrations.AddIndex(
+            model_name='serial',
+            index=models.Index(fields=['user', 'value_bidx'], name='serial_value_bidx'),
+        ),
+        migrations.AddIndex(
+            model_name='serial',
+            index=models.Index(fields=['user', 'description_bidx'], name='serial_desc_bidx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.4 on 2026-10-18 19:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_blind_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target', models.CharField(max_length=64)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('token', models.BigIntegerField()),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'search_token',
+                'indexes': [models.Index(fields=['user', 'target', 'token'], name='search_token_lookup'), models.Index(fields=['target', 'object_id'], name='search_token_object')],
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from dateutil.relativedelta import relativedelta
+from django.db import migrations
+
+
+# MySQL 인 경우에만 audit_log 테이블을 월 단위 RANGE 파티션으로 전환
+# (파티션 키는 모든 유니크 키에 포함되어야 하므로 기본 키를 (id, date)로 변경)
+def partition_audit_log(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "mysql":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT MIN(date) FROM audit_log")
+        min_date = cursor.fetchone()[0] or datetime.now()
+
+        month = min_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        last_month = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0) + relativedelta(months=1)
+
+        partitions = []
+        while month <= last_month:
+            next_month = month + relativedelta(months=1)
+            partitions.append(
+                f"PARTITION p{month:%Y%m} VALUES LESS THAN ('{next_month:%Y-%m-%d}')"
+            )
+            month = next_month
+        partitions.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+
+        cursor.execute("ALTER TABLE audit_log DROP PRIMARY KEY, ADD PRIMARY KEY (id, date)")
+        cursor.execute(
+            f"ALTER TABLE audit_log PARTITION BY RANGE COLUMNS(date) ({', '.join(partitions)})"
+        )
+
+
+def unpartition_audit_log(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "mysql":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute("ALTER TABLE audit_log REMOVE PARTITIONING")
+        cursor.execute("ALTER TABLE audit_log DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_audit_log_date_default'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_audit_log, unpartition_audit_log),
+    ]
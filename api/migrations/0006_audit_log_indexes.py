@@ -0,0 +1,29 @@
+# Generated by Django 5.1.4 on 2026-10-18 19:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_audit_log_partition'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['date', 'id'], name='audit_log_date'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['user', 'date'], name='audit_log_user_date'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['ip', 'date'], name='audit_log_ip_date'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['category', 'sub_category', 'date'], name='audit_log_category_date'),
+        ),
+    ]
@@ -0,0 +1,120 @@
+# Generated by Django 5.1.4 on 2026-10-18 19:39
+
+# MySQL 에서는 audit_log INSERT 트리거를 생성하므로 마이그레이션 계정에 TRIGGER 권한이 필요하며,
+# 바이너리 로그 사용 시 SUPER 권한이 없는 계정(RDS 등 관리형 MySQL)은 log_bin_trust_function_creators=1 설정 필요
+# (RDS / Aurora 는 DB 파라미터 그룹에서 설정)
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BACKFILL_BATCH_SIZE = 10000
+
+# 작성 시점의 토큰화 방식 (이후 앱 코드 변경과 무관하게 동일한 결과가 되도록 마이그레이션에 복사)
+NGRAM_SIZES = (1, 2)
+
+
+def make_ngrams(text):
+    result = set()
+
+    for word in text.lower().split():
+        for size in NGRAM_SIZES:
+            for i in range(len(word) - size + 1):
+                result.add(word[i : i + size])
+
+    return result
+
+
+# 기존 감사 로그 전문 검색 색인 생성
+# MySQL : INSERT 트리거 생성 후 기존 데이터 복사, 복사 완료 후 ngram FULLTEXT 인덱스 생성
+# 그 외 DB : 사본 및 n-gram 역색인을 아이디 순으로 나누어 기록
+def create_audit_log_search(apps, schema_editor):
+    connection = schema_editor.connection
+
+    if connection.vendor == "mysql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TRIGGER audit_log_search_insert AFTER INSERT ON audit_log FOR EACH ROW "
+                "INSERT INTO audit_log_search (id, action, date) VALUES (NEW.id, NEW.action, NEW.date)"
+            )
+
+            cursor.execute("SELECT MIN(id), MAX(id) FROM audit_log")
+            min_id, max_id = cursor.fetchone()
+            if min_id is not None:
+                for start_id in range(min_id, max_id + 1, BACKFILL_BATCH_SIZE):
+                    cursor.execute(
+                        "INSERT IGNORE INTO audit_log_search (id, action, date) "
+                        "SELECT id, action, date FROM audit_log WHERE id >= %s AND id < %s",
+                        [start_id, start_id + BACKFILL_BATCH_SIZE],
+                    )
+
+            cursor.execute(
+                "ALTER TABLE audit_log_search ADD FULLTEXT INDEX audit_log_search_action (action) WITH PARSER ngram"
+            )
+        return
+
+    AuditLog = apps.get_model("api", "AuditLog")
+    AuditLogSearch = apps.get_model("api", "AuditLogSearch")
+    AuditLogSearchToken = apps.get_model("api", "AuditLogSearchToken")
+
+    last_id = 0
+    while True:
+        logs = list(AuditLog.objects.filter(id__gt=last_id).order_by("id")[:BACKFILL_BATCH_SIZE])
+        if not logs:
+            break
+
+        AuditLogSearch.objects.bulk_create(
+            [AuditLogSearch(log_id=log.id, action=log.action, date=log.date) for log in logs],
+            batch_size=500,
+        )
+        AuditLogSearchToken.objects.bulk_create(
+            [
+                AuditLogSearchToken(log_id=log.id, token=token)
+                for log in logs
+                for token in make_ngrams(log.action)
+            ],
+            batch_size=1000,
+        )
+        last_id = logs[-1].id
+
+
+def drop_audit_log_search(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "mysql":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute("DROP TRIGGER IF EXISTS audit_log_search_insert")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_audit_log_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditLogSearch',
+            fields=[
+                ('log', models.OneToOneField(db_column='id', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search', serialize=False, to='api.auditlog')),
+                ('action', models.TextField()),
+                ('date', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'db_table': 'audit_log_search',
+            },
+        ),
+        migrations.CreateModel(
+            name='AuditLogSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('log_id', models.PositiveBigIntegerField()),
+                ('token', models.CharField(max_length=8)),
+            ],
+            options={
+                'db_table': 'audit_log_search_token',
+                'indexes': [models.Index(fields=['token', 'log_id'], name='audit_log_token_lookup')],
+            },
+        ),
+        migrations.RunPython(create_audit_log_search, drop_audit_log_search),
+    ]
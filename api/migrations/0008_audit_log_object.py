@@ -0,0 +1,32 @@
+# Generated by Django 5.1.4 on 2026-10-18 19:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_audit_log_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auditlog',
+            name='changes',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='auditlog',
+            name='object_id',
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='auditlog',
+            name='object_type',
+            field=models.CharField(blank=True, choices=[('bank_account', '계좌번호'), ('guest_book', '결혼식 방명록'), ('note', '노트'), ('serial', '시리얼 번호'), ('user', '사용자')], max_length=32, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['object_type', 'object_id', 'date'], name='audit_log_object_date'),
+        ),
+    ]
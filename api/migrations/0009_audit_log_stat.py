@@ -0,0 +1,42 @@
+# Generated by Django 5.1.4 on 2026-10-18 19:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_audit_log_object'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditLogStatState',
+            fields=[
+                ('name', models.CharField(max_length=32, primary_key=True, serialize=False)),
+                ('last_id', models.PositiveBigIntegerField(default=0)),
+                ('pending_id', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'audit_log_stat_state',
+            },
+        ),
+        migrations.CreateModel(
+            name='AuditLogStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('category', models.CharField(default='', max_length=32)),
+                ('sub_category', models.CharField(default='', max_length=32)),
+                ('result', models.IntegerField(choices=[(1, '성공'), (0, '실패')])),
+                ('user', models.CharField(default='', max_length=128)),
+                ('count', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'audit_log_stat',
+                'indexes': [models.Index(fields=['user', 'day'], name='audit_log_stat_user_day')],
+                'constraints': [models.UniqueConstraint(fields=('day', 'category', 'sub_category', 'result', 'user'), name='audit_log_stat_key')],
+            },
+        ),
+    ]
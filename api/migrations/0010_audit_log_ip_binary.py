@@ -0,0 +1,102 @@
+from django.db import migrations, models
+
+import api.models
+
+CONVERT_BATCH_SIZE = 10000
+
+# 작성 시점의 변환 방식 (이후 앱 코드 변경과 무관하게 동일한 결과가 되도록 마이그레이션에 복사)
+IPV4_MAPPED_PREFIX = b"\x00" * 10 + b"\xff\xff"
+
+
+# 정수(IPv4) IP를 16바이트(IPv4-mapped IPv6)로 변환 (IPv4 범위를 벗어난 값은 None)
+def int_to_ip_bytes(value):
+    if value is None or not 0 <= value < 2 ** 32:
+        return None
+
+    return IPV4_MAPPED_PREFIX + value.to_bytes(4, "big")
+
+
+# 정수(IPv4) IP를 16바이트(IPv4-mapped IPv6)로 아이디 구간 별 변환
+def convert_ip_to_binary(apps, schema_editor):
+    connection = schema_editor.connection
+    AuditLog = apps.get_model("api", "AuditLog")
+
+    if connection.vendor == "mysql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT MIN(id), MAX(id) FROM audit_log")
+            min_id, max_id = cursor.fetchone()
+            if min_id is None:
+                return
+
+            for start_id in range(min_id, max_id + 1, CONVERT_BATCH_SIZE):
+                cursor.execute(
+                    "UPDATE audit_log SET ip_bin = CONCAT(UNHEX('00000000000000000000FFFF'), UNHEX(LPAD(HEX(ip), 8, '0'))) "
+                    "WHERE id >= %s AND id < %s AND ip IS NOT NULL",
+                    [start_id, start_id + CONVERT_BATCH_SIZE],
+                )
+        return
+
+    last_id = 0
+    while True:
+        logs = list(
+            AuditLog.objects.filter(id__gt=last_id).order_by("id").only("id", "ip")[:CONVERT_BATCH_SIZE]
+        )
+        if not logs:
+            break
+
+        for log in logs:
+            log.ip_bin = int_to_ip_bytes(log.ip)
+        AuditLog.objects.bulk_update(logs, ["ip_bin"], batch_size=500)
+        last_id = logs[-1].id
+
+
+# 16바이트 IP를 정수로 되돌림 (IPv6 주소는 정수 컬럼에 저장할 수 없으므로 NULL)
+def convert_ip_to_int(apps, schema_editor):
+    AuditLog = apps.get_model("api", "AuditLog")
+
+    last_id = 0
+    while True:
+        logs = list(
+            AuditLog.objects.filter(id__gt=last_id).order_by("id").only("id", "ip_bin")[:CONVERT_BATCH_SIZE]
+        )
+        if not logs:
+            break
+
+        for log in logs:
+            ip_bin = bytes(log.ip_bin) if log.ip_bin is not None else b""
+            log.ip = int.from_bytes(ip_bin[12:], "big") if ip_bin[:12] == IPV4_MAPPED_PREFIX else None
+        AuditLog.objects.bulk_update(logs, ["ip"], batch_size=500)
+        last_id = logs[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_audit_log_stat'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='audit_log_ip_date',
+        ),
+        migrations.AddField(
+            model_name='auditlog',
+            name='ip_bin',
+            field=api.models.IPAddressBinaryField(blank=True, null=True),
+        ),
+        migrations.RunPython(convert_ip_to_binary, convert_ip_to_int),
+        migrations.RemoveField(
+            model_name='auditlog',
+            name='ip',
+        ),
+        migrations.RenameField(
+            model_name='auditlog',
+            old_name='ip_bin',
+            new_name='ip',
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['ip', 'date'], name='audit_log_ip_date'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.1.4 on 2026-10-18 20:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_user_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bankaccount',
+            index=models.Index(fields=['user', 'bank'], name='bank_account_user_bank'),
+        ),
+        migrations.AddIndex(
+            model_name='bankaccount',
+            index=models.Index(fields=['user', 'account_holder'], name='bank_account_user_holder'),
+        ),
+        migrations.AddIndex(
+            model_name='guestbook',
+            index=models.Index(fields=['user', 'date'], name='guest_book_user_date'),
+        ),
+        migrations.AddIndex(
+            model_name='guestbook',
+            index=models.Index(fields=['user', 'name'], name='guest_book_user_name'),
+        ),
+        migrations.AddIndex(
+            model_name='guestbook',
+            index=models.Index(fields=['user', 'amount'], name='guest_book_user_amount'),
+        ),
+        migrations.AddIndex(
+            model_name='guestbook',
+            index=models.Index(fields=['user', 'area'], name='guest_book_user_area'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['user', 'date'], name='note_user_date'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['user', 'title'], name='note_user_title'),
+        ),
+        migrations.AddIndex(
+            model_name='serial',
+            index=models.Index(fields=['user', 'type'], name='serial_user_type'),
+        ),
+        migrations.AddIndex(
+            model_name='serial',
+            index=models.Index(fields=['user', 'title'], name='serial_user_title'),
+        ),
+    ]
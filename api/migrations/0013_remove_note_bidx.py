@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-18 20:33
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_user_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='note',
+            name='note_note_bidx',
+        ),
+        migrations.RemoveField(
+            model_name='note',
+            name='note_bidx',
+        ),
+    ]
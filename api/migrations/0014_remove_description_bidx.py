@@ -0,0 +1,29 @@
+# Generated by Django 5.1.4 on 2026-10-18 20:52
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_remove_note_bidx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='bankaccount',
+            name='bank_account_desc_bidx',
+        ),
+        migrations.RemoveIndex(
+            model_name='serial',
+            name='serial_desc_bidx',
+        ),
+        migrations.RemoveField(
+            model_name='bankaccount',
+            name='description_bidx',
+        ),
+        migrations.RemoveField(
+            model_name='serial',
+            name='description_bidx',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.4 on 2026-10-18 20:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_remove_description_bidx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['category', 'date'], name='audit_log_category_only_date'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.contrib.auth.models import User
 from django.db import models
+from django.utils import timezone
 
 
 def choice_str_to_int(choice_class, input_value):
@@ -9,6 +10,27 @@ def choice_str_to_int(choice_class, input_value):
     return None
 
 
+class IPAddressBinaryField(models.BinaryField):
+    """
+    IP 주소 16바이트 저장 필드 (IPv4는 IPv4-mapped IPv6 형식으로 저장하여 IPv4/IPv6 대역을 같은 순서로 범위 검색)
+    MySQL은 BinaryField 기본 타입(longblob)에 인덱스를 생성할 수 없으므로 binary(16) 사용
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs["max_length"] = 16
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        del kwargs["max_length"]
+        return name, path, args, kwargs
+
+    def db_type(self, connection):
+        if connection.vendor == "mysql":
+            return "binary(16)"
+        return super().db_type(connection)
+
+
 class ChoiceResult(models.IntegerChoices):
     SUCCESS = 1, "성공"
     FAIL = 0, "실패"
@@ -19,23 +41,126 @@ class ChoiceAccountStatus(models.IntegerChoices):
     INACTIVE = 0, "비활성화"
 
 
+class ChoiceObjectType(models.TextChoices):
+    BANK_ACCOUNT = "bank_account", "계좌번호"
+    GUEST_BOOK = "guest_book", "결혼식 방명록"
+    NOTE = "note", "노트"
+    SERIAL = "serial", "시리얼 번호"
+    USER = "user", "사용자"
+
+
 class AuditLog(models.Model):
     user = models.CharField(max_length=128, blank=True, null=True)
-    ip = models.PositiveIntegerField(blank=True, null=True)
+    ip = IPAddressBinaryField(blank=True, null=True)
     category = models.CharField(max_length=32, blank=True, null=True)
     sub_category = models.CharField(max_length=32, blank=True, null=True)
     action = models.TextField()
     result = models.IntegerField(choices=ChoiceResult.choices)
-    date = models.DateTimeField(auto_now_add=True)
+    # 대상 객체 (유형, 아이디) 및 변경 내역 : {필드: {"before": 이전 값, "after": 변경 값}}
+    # 암호화 필드는 값을 남기지 않고 {"changed": true}로 기록
+    object_type = models.CharField(max_length=32, choices=ChoiceObjectType.choices, blank=True, null=True)
+    object_id = models.PositiveBigIntegerField(blank=True, null=True)
+    changes = models.JSONField(blank=True, null=True)
+    # 버퍼링 후 일괄 저장 시에도 발생 시각이 유지되도록 auto_now_add 대신 default 사용
+    date = models.DateTimeField(default=timezone.now)
 
     class Meta:
         db_table = "audit_log"
         ordering = ["id"]
+        # AuditLogFilter 검색 조건(기간, 사용자, IP, 카테고리, 대상 객체) 별 인덱스 (목록 정렬 기준인 date 로 끝나도록 구성)
+        indexes = [
+            models.Index(fields=["date", "id"], name="audit_log_date"),
+            models.Index(fields=["user", "date"], name="audit_log_user_date"),
+            models.Index(fields=["ip", "date"], name="audit_log_ip_date"),
+            models.Index(fields=["category", "date"], name="audit_log_category_only_date"),
+            models.Index(fields=["category", "sub_category", "date"], name="audit_log_category_date"),
+            models.Index(fields=["object_type", "object_id", "date"], name="audit_log_object_date"),
+        ]
+
+
+class AuditLogSearch(models.Model):
+    """
+    감사 로그 내용(action) 전문 검색용 사본 테이블
+    파티션 테이블(audit_log)은 FULLTEXT 인덱스를 지원하지 않으므로 별도 테이블에 ngram FULLTEXT 인덱스 생성 (MySQL)
+    MySQL은 audit_log INSERT 트리거로, 그 외 DB는 저장 시 search_helper에서 함께 기록
+    """
+
+    # 파티션 테이블은 외래 키 참조를 지원하지 않으므로 제약 조건 없이 연결
+    log = models.OneToOneField(
+        AuditLog,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column="id",
+        db_constraint=False,
+        related_name="search",
+    )
+    action = models.TextField()
+    # 보관 기간이 지난 파티션 삭제 시 함께 정리하기 위한 발생 시각
+    date = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = "audit_log_search"
+
+
+class AuditLogSearchToken(models.Model):
+    # 감사 로그 내용 n-gram 역색인 (FULLTEXT 인덱스를 지원하지 않는 DB에서 사용)
+    log_id = models.PositiveBigIntegerField()
+    token = models.CharField(max_length=8)
+
+    class Meta:
+        db_table = "audit_log_search_token"
+        indexes = [
+            models.Index(fields=["token", "log_id"], name="audit_log_token_lookup"),
+        ]
+
+
+class AuditLogStat(models.Model):
+    """
+    감사 로그 일 단위 집계 (일자 x 카테고리 x 하위 카테고리 x 결과 x 사용자 별 건수)
+    rollup_audit_log 명령(주기 실행)에서 증분 집계, 통계 조회 시 원본 대신 사용
+    유니크 제약 조건에서 NULL은 중복 허용되므로 값이 없는 경우 빈 문자열로 저장
+    """
+
+    day = models.DateField()
+    category = models.CharField(max_length=32, default="")
+    sub_category = models.CharField(max_length=32, default="")
+    result = models.IntegerField(choices=ChoiceResult.choices)
+    user = models.CharField(max_length=128, default="")
+    count = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        db_table = "audit_log_stat"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "category", "sub_category", "result", "user"],
+                name="audit_log_stat_key",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["user", "day"], name="audit_log_stat_user_day"),
+        ]
+
+
+class AuditLogStatState(models.Model):
+    """
+    감사 로그 집계 진행 상태
+    last_id : 집계 완료된 마지막 감사 로그 아이디
+    pending_id : 이전 실행 시점의 최대 아이디 (실행 중이던 트랜잭션의 커밋을 기다리기 위해 다음 실행에서 집계)
+    """
+
+    name = models.CharField(max_length=32, primary_key=True)
+    last_id = models.PositiveBigIntegerField(default=0)
+    pending_id = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "audit_log_stat_state"
 
 
 class BankAccount(models.Model):
     bank = models.CharField(max_length=256)
     account = models.CharField(max_length=512)
+    account_bidx = models.CharField(max_length=32, blank=True, null=True)
     account_holder = models.CharField(max_length=256)
     description = models.CharField(max_length=1024, blank=True, null=True)
     user = models.ForeignKey(User, null=True, blank=True, on_delete=models.CASCADE)
@@ -44,6 +169,12 @@ class BankAccount(models.Model):
         db_table = "bank_account"
         unique_together = (("bank", "account"),)
         ordering = ["id"]
+        indexes = [
+            models.Index(fields=["user", "account_bidx"], name="bank_account_account_bidx"),
+            # 사용자 별 정렬 (OrderingFilter)
+            models.Index(fields=["user", "bank"], name="bank_account_user_bank"),
+            models.Index(fields=["user", "account_holder"], name="bank_account_user_holder"),
+        ]
 
 
 class GuestBook(models.Model):
@@ -58,6 +189,13 @@ class GuestBook(models.Model):
     class Meta:
         db_table = "guest_book"
         ordering = ["id"]
+        indexes = [
+            # 사용자 별 기간 검색 및 정렬 (OrderingFilter)
+            models.Index(fields=["user", "date"], name="guest_book_user_date"),
+            models.Index(fields=["user", "name"], name="guest_book_user_name"),
+            models.Index(fields=["user", "amount"], name="guest_book_user_amount"),
+            models.Index(fields=["user", "area"], name="guest_book_user_area"),
+        ]
 
 
 class Note(models.Model):
@@ -69,15 +207,78 @@ class Note(models.Model):
     class Meta:
         db_table = "note"
         ordering = ["id"]
+        indexes = [
+            # 사용자 별 기간 검색 및 정렬 (OrderingFilter)
+            models.Index(fields=["user", "date"], name="note_user_date"),
+            models.Index(fields=["user", "title"], name="note_user_title"),
+        ]
 
 
 class Serial(models.Model):
     type = models.CharField(max_length=4)
     title = models.CharField(max_length=512)
     value = models.CharField(max_length=512, blank=True, null=True)
+    value_bidx = models.CharField(max_length=32, blank=True, null=True)
     description = models.CharField(max_length=1024, blank=True, null=True)
     user = models.ForeignKey(User, null=True, blank=True, on_delete=models.CASCADE)
 
     class Meta:
         db_table = "serial"
         ordering = ["id"]
+        indexes = [
+            models.Index(fields=["user", "value_bidx"], name="serial_value_bidx"),
+            # 사용자 별 정렬 (OrderingFilter)
+            models.Index(fields=["user", "type"], name="serial_user_type"),
+            models.Index(fields=["user", "title"], name="serial_user_title"),
+        ]
+
+
+class SearchToken(models.Model):
+    # 암호화 필드 부분 일치 검색을 위한 n-gram 토큰(HMAC) 역색인
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    target = models.CharField(max_length=64)
+    object_id = models.PositiveBigIntegerField()
+    token = models.BigIntegerField()
+
+    class Meta:
+        db_table = "search_token"
+        indexes = [
+            models.Index(fields=["user", "target", "token"], name="search_token_lookup"),
+            models.Index(fields=["target", "object_id"], name="search_token_object"),
+        ]
+
+
+class UserStat(models.Model):
+    # 사용자 별 항목 건수 (항목 추가/삭제와 같은 트랜잭션에서 증감, reconcile_user_stats 로 매일 보정)
+    user = models.OneToOneField(User, primary_key=True, on_delete=models.CASCADE)
+    bank_account_count = models.IntegerField(default=0)
+    guest_book_count = models.IntegerField(default=0)
+    note_count = models.IntegerField(default=0)
+    serial_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "user_stats"
+
+
+# 암호화 필드 목록 : {모델: ((암호화 필드, 블라인드 인덱스 필드), ...)} (동등 비교 검색을 하지 않는 필드는 블라인드 인덱스 None)
+ENCRYPTED_FIELDS = {
+    BankAccount: (("account", "account_bidx"), ("description", None)),
+    Note: (("note", None),),
+    Serial: (("value", "value_bidx"), ("description", None)),
+}
+
+# 부분 일치 검색 필드 목록 : {모델: (암호화 필드, ...)}
+SEARCH_FIELDS = {
+    BankAccount: ("description",),
+    Note: ("note",),
+    Serial: ("description",),
+}
+
+# 사용자 통계 건수 필드 목록 : {모델: 건수 필드}
+USER_STAT_FIELDS = {
+    BankAccount: "bank_account_count",
+    GuestBook: "guest_book_count",
+    Note: "note_count",
+    Serial: "serial_count",
+}
@@ -1,11 +1,36 @@
+from django.conf import settings
 from rest_framework import permissions
+from rest_framework_simplejwt.tokens import Token
 
+ADMIN_GROUP = "관리자"
+USER_GROUP = "사용자"
 
-def check_admin(request):
-    return request.user.groups.filter(name="관리자").exists()
 
-def check_user(request):
-    return request.user.groups.filter(name="사용자").exists()
+# 요청 사용자의 그룹 목록
+# 서명된 JWT 의 groups 클레임을 우선 사용하고, 클레임이 없거나 DB 확인이 필요한 경우 DB 조회 결과를 요청 단위로 저장
+def get_request_groups(request, use_token=True):
+    if use_token:
+        token = getattr(request, "auth", None)
+        groups = token.get("groups") if isinstance(token, Token) else None
+        if isinstance(groups, list):
+            return groups
+
+    groups = getattr(request, "_db_groups", None)
+    if groups is None:
+        if request.user.is_authenticated:
+            groups = list(request.user.groups.values_list("name", flat=True))
+        else:
+            groups = []
+        request._db_groups = groups
+
+    return groups
+
+
+def check_admin(request, use_token=True):
+    return ADMIN_GROUP in get_request_groups(request, use_token)
+
+def check_user(request, use_token=True):
+    return USER_GROUP in get_request_groups(request, use_token)
 
 
 class PermissionAdmin(permissions.BasePermission):
@@ -13,7 +38,8 @@ class PermissionAdmin(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return check_admin(request) or check_user(request)
 
-        return check_admin(request)
+        # 토큰 발급 이후 회수된 관리자 권한을 즉시 차단해야 하는 경우 DB로 확인 (PERMISSION_ADMIN_DB_CHECK)
+        return check_admin(request, use_token=not settings.PERMISSION_ADMIN_DB_CHECK)
 
 
 class PermissionUser(permissions.BasePermission):
@@ -1,10 +1,108 @@
-from django.contrib.auth.models import User, Group
+from django.contrib.auth.models import User
 from rest_framework import serializers
 
-from utils.format_helper import int_to_ip, datetime_to_str
+from utils.aes_helper import make_enc_value, get_dec_value, decrypt_many, make_blind_index
+from utils.format_helper import bytes_to_ip, datetime_to_str
 from .models import AuditLog, BankAccount, GuestBook, Note, Serial
 
 
+class EncryptedCharField(serializers.CharField):
+    """
+    입력 시 암호화, 출력 시 복호화를 수행하는 필드
+    max_length는 평문이 아닌 암호문(DB 컬럼) 길이를 기준으로 검사
+    blind_index에 모델 필드명을 지정하면 EncryptedModelSerializer에서 블라인드 인덱스를 함께 저장
+    (블라인드 인덱스는 암호화 전 평문으로 계산하여 blind_index_value에 보관)
+    """
+
+    def __init__(self, blind_index=None, **kwargs):
+        self.enc_max_length = kwargs.pop("max_length", None)
+        self.blind_index = blind_index
+        self.blind_index_value = None
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        self.blind_index_value = make_blind_index(value) if self.blind_index and value else None
+        if not value:
+            return value
+
+        enc_value = make_enc_value(value)
+        if self.enc_max_length is not None and len(enc_value) > self.enc_max_length:
+            self.fail("max_length", max_length=self.enc_max_length)
+
+        return enc_value
+
+    def to_representation(self, value):
+        # 목록 조회 시에는 EncryptedListSerializer에서 일괄 복호화 수행
+        if not value or getattr(self.parent, "defer_decrypt", False):
+            return value
+
+        return get_dec_value(value)
+
+
+class EncryptedTextField(EncryptedCharField):
+    def __init__(self, **kwargs):
+        kwargs.setdefault("style", {"base_template": "textarea.html"})
+        super().__init__(**kwargs)
+
+
+class OwnerUsernameField(serializers.ReadOnlyField):
+    """
+    항목 소유자의 아이디 (source="user.username")
+    요청 사용자의 항목인 경우 인증 시 조회한 요청 사용자 객체를 사용하여 행 별 사용자 조회 제거
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("source", "user.username")
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        request = self.context.get("request")
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated and instance.user_id == user.pk:
+            return user.username
+
+        return super().get_attribute(instance)
+
+
+class EncryptedListSerializer(serializers.ListSerializer):
+    """
+    many=True 직렬화 시 암호화 필드를 컬럼 단위로 일괄 복호화
+    """
+
+    def to_representation(self, data):
+        self.child.defer_decrypt = True
+        try:
+            rows = super().to_representation(data)
+        finally:
+            self.child.defer_decrypt = False
+
+        for field_name, field in self.child.fields.items():
+            if field.write_only or not isinstance(field, EncryptedCharField):
+                continue
+
+            dec_values = decrypt_many([row.get(field_name) for row in rows])
+            for row, dec_value in zip(rows, dec_values):
+                row[field_name] = dec_value
+
+        return rows
+
+
+class EncryptedModelSerializer(serializers.ModelSerializer):
+    def to_internal_value(self, data):
+        ret = super().to_internal_value(data)
+
+        # 암호화 필드의 블라인드 인덱스 갱신
+        for field in self._writable_fields:
+            if not isinstance(field, EncryptedCharField) or not field.blind_index:
+                continue
+
+            if field.source in ret:
+                ret[field.blind_index] = field.blind_index_value if ret.get(field.source) else None
+
+        return ret
+
+
 class DashboardStatsSerializer(serializers.Serializer):
     bank_account_count = serializers.IntegerField()
     guest_book_count = serializers.IntegerField()
@@ -39,7 +137,8 @@ class UsersSerializer(serializers.ModelSerializer):
         return '활성화' if obj.is_active else '비활성화'
 
     def get_permission(self, obj):
-        return Group.objects.filter(user=obj).values_list('name', flat=True)
+        # UsersAPI 에서 prefetch_related('groups')로 함께 조회한 그룹 사용
+        return [group.name for group in obj.groups.all()]
 
     def get_created_at(self, obj):
         result = ""
@@ -68,7 +167,7 @@ class AuditLogSerializer(serializers.ModelSerializer):
     def get_ip(self, obj):
         result = None
         if obj.ip:
-            result = int_to_ip(obj.ip)
+            result = bytes_to_ip(obj.ip)
 
         return result
 
@@ -88,25 +187,34 @@ class AuditLogSerializer(serializers.ModelSerializer):
         # fields = ('id', 'user', 'ip', 'category', 'sub_category', 'action', 'result', 'date')
 
 
-class BankAccountSerializer(serializers.ModelSerializer):
-    user = serializers.ReadOnlyField(source="user.username")
+class BankAccountSerializer(EncryptedModelSerializer):
+    account = EncryptedCharField(max_length=512, blind_index="account_bidx")
+    description = EncryptedCharField(
+        max_length=1024,
+        required=False,
+        allow_null=True,
+        allow_blank=True,
+    )
+    user = OwnerUsernameField()
 
     class Meta:
         model = BankAccount
-        fields = "__all__"
+        exclude = ("account_bidx",)
+        list_serializer_class = EncryptedListSerializer
 
 
 class GuestBookSerializer(serializers.ModelSerializer):
-    user = serializers.ReadOnlyField(source="user.username")
+    user = OwnerUsernameField()
 
     class Meta:
         model = GuestBook
         fields = "__all__"
 
 
-class NoteSerializer(serializers.ModelSerializer):
+class NoteSerializer(EncryptedModelSerializer):
+    note = EncryptedTextField()
     date = serializers.SerializerMethodField()
-    user = serializers.ReadOnlyField(source="user.username")
+    user = OwnerUsernameField()
 
     def get_date(self, obj):
         result = ""
@@ -118,14 +226,29 @@ class NoteSerializer(serializers.ModelSerializer):
     class Meta:
         model = Note
         fields = "__all__"
-
-
-class SerialSerializer(serializers.ModelSerializer):
-    user = serializers.ReadOnlyField(source="user.username")
+        list_serializer_class = EncryptedListSerializer
+
+
+class SerialSerializer(EncryptedModelSerializer):
+    value = EncryptedCharField(
+        max_length=512,
+        required=False,
+        allow_null=True,
+        allow_blank=True,
+        blind_index="value_bidx",
+    )
+    description = EncryptedCharField(
+        max_length=1024,
+        required=False,
+        allow_null=True,
+        allow_blank=True,
+    )
+    user = OwnerUsernameField()
 
     class Meta:
         model = Serial
-        fields = "__all__"
+        exclude = ("value_bidx",)
+        list_serializer_class = EncryptedListSerializer
 
 
 class LottoSerializer(serializers.Serializer):
@@ -0,0 +1,281 @@
+import io
+from datetime import datetime, timedelta
+from unittest import mock
+
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.test import APITestCase
+
+from api.models import AuditLog, BankAccount, GuestBook, Note, Serial
+from api.management.commands.explain_audit_log import Command as ExplainAuditLogCommand
+from api.permissions import ADMIN_GROUP, USER_GROUP
+from config.paginations import EstimatedCount
+from config.tokens import CustomTokenObtainPairSerializer
+from utils.aes_helper import make_enc_value
+from utils.group_helper import GROUP_CACHE_KEY, get_groups
+
+
+class QueryCountTestCase(APITestCase):
+    """
+    목록 조회 쿼리 수 회귀 테스트 공통 설정 (로그인 시 발급되는 JWT 로 인증)
+    """
+
+    fixtures = ['api/data_auth.json']
+
+    def setUp(self):
+        cache.clear()
+
+    def authenticate(self, user):
+        token = CustomTokenObtainPairSerializer().get_token(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+
+class UsersAPIQueryCountTest(QueryCountTestCase):
+    url = '/api/v1/account/users'
+
+    def setUp(self):
+        super().setUp()
+
+        self.admin = User.objects.create_user('admin', 'admin@test.com', 'password')
+        self.admin.groups.add(Group.objects.get(name=ADMIN_GROUP))
+        self.authenticate(self.admin)
+
+    def create_users(self, count):
+        admin_group = Group.objects.get(name=ADMIN_GROUP)
+        user_group = Group.objects.get(name=USER_GROUP)
+
+        users = User.objects.bulk_create(
+            [User(username=f'user{User.objects.count()}_{i}', password='!') for i in range(count)]
+        )
+        User.groups.through.objects.bulk_create([
+            User.groups.through(user_id=user.id, group_id=(admin_group if i % 2 else user_group).id)
+            for i, user in enumerate(users)
+        ])
+
+    def test_list_query_count_is_constant(self):
+        # 그룹 캐시 적재
+        self.client.get(self.url)
+
+        # 인증 사용자 조회 1 + COUNT 1 + 사용자 목록 1 + 그룹 prefetch 1 (사용자 수와 무관)
+        for count in (5, 50):
+            self.create_users(count)
+
+            with self.assertNumQueries(4):
+                response = self.client.get(self.url, {'page_size': 100})
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data['results']), User.objects.count())
+            self.assertTrue(all(row['permission'] for row in response.data['results']))
+
+    def test_list_query_count_with_cold_group_cache(self):
+        self.create_users(5)
+
+        # 그룹 캐시가 비어 있는 경우 권한 필터 선택 항목 조회 1회 추가
+        cache.clear()
+        with self.assertNumQueries(5):
+            self.client.get(self.url, {'permission': ADMIN_GROUP})
+
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url, {'permission': ADMIN_GROUP})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(ADMIN_GROUP in row['permission'] for row in response.data['results']))
+
+
+class GroupCacheTest(QueryCountTestCase):
+    """
+    다른 워커의 캐시에 남아 있는 삭제된 그룹을 사용자 권한 변경에 사용하지 않는지 확인
+    """
+
+    def test_get_groups_ignores_stale_cache(self):
+        group = Group.objects.create(name='임시')
+        stale_group_map = {group.name: group, ADMIN_GROUP: Group.objects.get(name=ADMIN_GROUP)}
+        group.delete()
+
+        # 그룹 삭제 시 캐시를 비우지 못한 워커의 캐시
+        cache.set(GROUP_CACHE_KEY, stale_group_map)
+
+        self.assertEqual([group.name for group in get_groups([ADMIN_GROUP, '임시'])], [ADMIN_GROUP])
+
+
+class OwnerUsernameQueryCountTest(QueryCountTestCase):
+    """
+    사용자 별 리소스 목록 / 상세 조회 시 작성자 아이디(user)를 행 별로 조회하지 않는지 확인
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.user = User.objects.create_user('owner', 'owner@test.com', 'password')
+        self.user.groups.add(Group.objects.get(name=USER_GROUP))
+        self.authenticate(self.user)
+
+    def create_rows(self, model, count):
+        factories = {
+            Note: lambda i: Note(title=f'제목{i}', note=make_enc_value('내용'), user=self.user),
+            GuestBook: lambda i: GuestBook(name=f'이름{i}', attend='Y', user=self.user),
+            Serial: lambda i: Serial(type='t', title=f'제목{i}', value=make_enc_value('값'), user=self.user),
+            BankAccount: lambda i: BankAccount(bank='은행', account=make_enc_value(f'계좌{i}'), account_holder='예금주', user=self.user),
+        }
+        start = model.objects.count()
+        model.objects.bulk_create([factories[model](i) for i in range(start, start + count)])
+
+    def test_owner_username_query_count(self):
+        for model, url in (
+            (Note, '/api/v1/note'),
+            (GuestBook, '/api/v1/guest-book'),
+            (Serial, '/api/v1/serial'),
+            (BankAccount, '/api/v1/bank-account'),
+        ):
+            with self.subTest(url=url):
+                # 인증 사용자 조회 1 + COUNT 1 + 목록 1 (행 수와 무관)
+                for count in (1, 30):
+                    self.create_rows(model, count)
+
+                    with self.assertNumQueries(3):
+                        response = self.client.get(url, {'page_size': 100})
+
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(len(response.data['results']), model.objects.filter(user=self.user).count())
+                    self.assertEqual({row['user'] for row in response.data['results']}, {self.user.username})
+
+                # 인증 사용자 조회 1 + 상세 1
+                with self.assertNumQueries(2):
+                    response = self.client.get(f"{url}/{response.data['results'][0]['id']}")
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data['user'], self.user.username)
+
+
+# 감사 로그는 테스트 트랜잭션 안에서 바로 저장
+@override_settings(AUDIT_LOG_ASYNC=False)
+class SearchContainsTest(QueryCountTestCase):
+    """
+    암호화 필드 부분 일치 검색 : 토큰 후보 중 실제로 검색어를 포함하는 항목만 조회
+    """
+
+    url = '/api/v1/note'
+
+    def setUp(self):
+        super().setUp()
+
+        self.user = User.objects.create_user('owner', 'owner@test.com', 'password')
+        self.user.groups.add(Group.objects.get(name=USER_GROUP))
+        self.authenticate(self.user)
+
+        self.ids = {
+            text: self.client.post(self.url, {'title': text, 'note': text}, format='json').data['id']
+            for text in ('ab ba', 'xabab', 'Hello World')
+        }
+
+    def search(self, value):
+        return self.client.get(self.url, {'note': value})
+
+    def test_search_excludes_non_contiguous_token_matches(self):
+        response = self.search('abab')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual([row['id'] for row in response.data['results']], [self.ids['xabab']])
+
+    def test_search_across_words(self):
+        response = self.search('lo wo')
+
+        self.assertEqual([row['id'] for row in response.data['results']], [self.ids['Hello World']])
+
+    def test_search_requires_word_of_min_length(self):
+        for value in ('a', 'a b', ' o W '):
+            with self.subTest(value=value):
+                self.assertEqual(self.search(value).status_code, 400)
+
+
+class AuditLogPaginationTest(QueryCountTestCase):
+    """
+    감사 로그 목록 : 첫 페이지만 건수 계산 (추정 건수가 기준 이상이면 COUNT(*) 없이 추정치), 이후 페이지는 건수 계산 없음
+    """
+
+    url = '/api/v1/audit-log'
+
+    def setUp(self):
+        super().setUp()
+
+        self.admin = User.objects.create_user('admin', 'admin@test.com', 'password')
+        self.admin.groups.add(Group.objects.get(name=ADMIN_GROUP))
+        self.authenticate(self.admin)
+
+        date = datetime(2024, 1, 1)
+        AuditLog.objects.bulk_create([
+            AuditLog(user='admin', category='계정', sub_category='로그인', action=f'로그인 {i}', result=1, date=date + timedelta(minutes=i))
+            for i in range(15)
+        ])
+
+    def test_first_page_uses_estimated_count(self):
+        # 추정치가 기준 이상이면 COUNT(*) 없음 : 인증 사용자 조회 1 + 목록 1 (추정 조회는 mock)
+        with mock.patch.object(EstimatedCount, 'estimate', return_value=10 ** 7) as estimate:
+            with self.assertNumQueries(2):
+                response = self.client.get(self.url, {'page_size': 10})
+
+        estimate.assert_called_once()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 10 ** 7)
+        self.assertIs(response.data['count_exact'], False)
+
+    def test_first_page_counts_exactly_below_threshold(self):
+        # 추정할 수 없거나 (MySQL 외 DB) 기준 미만이면 COUNT(*) : 인증 사용자 조회 1 + COUNT 1 + 목록 1
+        with mock.patch.object(EstimatedCount, 'estimate', return_value=None):
+            with self.assertNumQueries(3):
+                response = self.client.get(self.url, {'page_size': 10})
+
+        self.assertEqual(response.data['count'], 15)
+        self.assertIs(response.data['count_exact'], True)
+
+    def test_next_page_skips_count(self):
+        response = self.client.get(self.url, {'page_size': 10})
+
+        with mock.patch.object(EstimatedCount, 'count') as count:
+            with self.assertNumQueries(2):
+                response = self.client.get(response.data['next'])
+
+        count.assert_not_called()
+        self.assertEqual(len(response.data['results']), 5)
+        self.assertIsNone(response.data['count'])
+        self.assertIsNone(response.data['count_exact'])
+
+
+class ExplainAuditLogTest(TestCase):
+    """
+    감사 로그 검색 조건 별 목록 첫 페이지 조회가 전체 테이블 스캔이나 허용하지 않은 정렬 없이 인덱스를 사용하는지 확인
+    """
+
+    def test_filter_cases_use_index_order(self):
+        out = io.StringIO()
+        call_command('explain_audit_log', stdout=out)
+
+        self.assertNotIn('[FAIL]', out.getvalue())
+
+    def test_explain_flags_sort(self):
+        command = ExplainAuditLogCommand()
+
+        _, full_scan, sort = command.explain(AuditLog.objects.filter(category='노트 관리').order_by('-id')[:11])
+        self.assertFalse(full_scan)
+        self.assertTrue(sort)
+
+        _, full_scan, sort = command.explain(command.get_page_queryset(AuditLog.objects.filter(category='노트 관리').order_by('date')))
+        self.assertFalse(full_scan)
+        self.assertFalse(sort)
+
+
+class BenchmarkAESTest(TestCase):
+    """
+    암복호화 시간 측정 명령 실행 확인 (측정 값은 환경에 따라 다르므로 출력 항목만 확인)
+    """
+
+    def test_benchmark_runs(self):
+        out = io.StringIO()
+        call_command('benchmark_aes', values=5, number=1, repeat=1, stdout=out)
+
+        self.assertIn('encrypt_many', out.getvalue())
+        self.assertIn('decrypt_many', out.getvalue())
+        self.assertIn('봉투 형식', out.getvalue())
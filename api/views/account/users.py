@@ -1,19 +1,21 @@
 import logging
 
-from django.contrib.auth.models import User, Group
+from django.contrib.auth.models import User
 from django.db import transaction
+from django.utils.choices import CallableChoiceIterator
+from django.utils.functional import lazy
 from django_filters import rest_framework as filters
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 
 from api import message
-from api.models import ChoiceAccountStatus
+from api.models import ChoiceAccountStatus, ChoiceObjectType
 from api.permissions import PermissionAdmin
 from api.serializers import UsersSerializer
 from utils.dic_helper import get_dic_value
 from utils.format_helper import to_str, choice_str_to_int
-from utils.log_helper import insert_audit_log
-from utils.network_helper import get_client_ip
+from utils.group_helper import get_groups, get_group_choices
+from utils.log_helper import insert_audit_log, get_audit_context
 
 logger = logging.getLogger(__name__)
 
@@ -24,13 +26,13 @@ sub_category = '사용자 관리'
 
 class UsersFilter(filters.FilterSet):
     status_list = [list(reversed(choice_account_status)) for choice_account_status in list(ChoiceAccountStatus.choices)]
-    permission_list = [(group.name, group.name) for group in Group.objects.all()]
 
     user_id = filters.filters.CharFilter(field_name='username', lookup_expr='icontains')
     name = filters.CharFilter(field_name='first_name', lookup_expr='icontains')
     email = filters.CharFilter(field_name='email', lookup_expr='icontains')
     status = filters.ChoiceFilter(choices=status_list, method='status_filter', help_text=f'Available values : {", ".join(list(zip(*ChoiceAccountStatus.choices))[1])}')
-    permission = filters.ChoiceFilter(choices=permission_list, method='permission_filter', help_text=f'Available values : {", ".join([perm[0] for perm in permission_list])}')
+    # 권한 선택 항목은 기동 시점이 아닌 검증 시점에 그룹 캐시에서 조회
+    permission = filters.ChoiceFilter(choices=CallableChoiceIterator(get_group_choices), method='permission_filter', help_text=lazy(lambda: f'Available values : {", ".join(name for name, _ in get_group_choices())}', str)())
 
     def status_filter(self, queryset, name, value):
         return queryset.filter(is_active=choice_str_to_int(ChoiceAccountStatus, value))
@@ -60,7 +62,8 @@ class UsersFilter(filters.FilterSet):
 class UsersAPI(viewsets.ModelViewSet):
     serializer_class = UsersSerializer
     permission_classes = [PermissionAdmin]
-    queryset = User.objects.all().defer('password').order_by('id')
+    # 권한(그룹)은 사용자 목록과 함께 1회 조회 (사용자 별 그룹 조회 제거)
+    queryset = User.objects.all().defer('password').prefetch_related('groups').order_by('id')
 
     # 지원 HTTP 메소드 설정 (CRUD)
     http_method_names = ["get", "post", "put", "delete"]
@@ -69,8 +72,10 @@ class UsersAPI(viewsets.ModelViewSet):
     filterset_class = UsersFilter
 
     def create(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 대상 아이디, 변경 내역
         actions = []
+        object_id = None
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
@@ -87,7 +92,8 @@ class UsersAPI(viewsets.ModelViewSet):
             name = request.data.get('name', '')
             email = request.data.get('email', '')
             user_status = request.data.get('user_status', '')
-            permission_list = sorted(request.data.get('permission', '').split(','))
+            permission = request.data.get('permission', '')
+            permission_list = sorted(permission.split(','))
 
             if not user_id or not password or not name or not email or not user_status or not permission:
                 data = []
@@ -105,24 +111,25 @@ class UsersAPI(viewsets.ModelViewSet):
                     data.append({'permission': [message.required_field]})
                 return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
-            if User.objects.filter(id=user_id).exists():
+            if User.objects.filter(username=user_id).exists():
                 return Response({'user_id': [message.duplicated]}, status=status.HTTP_409_CONFLICT)
 
             if not all(permission in ['사용자', '관리자'] for permission in permission_list):
                 return Response({'permission': [message.invalid_permission_field]}, status=status.HTTP_400_BAD_REQUEST)
 
-            if not Group.objects.filter(name=permission).exists():
+            groups = get_groups(permission_list)
+            if len(groups) != len(permission_list):
                 return Response({'permission': [message.not_found]}, status=status.HTTP_404_NOT_FOUND)
 
-            user = User.objects.create_user(user_id, email, password)
-            user.is_active = True if user_status == '활성화' else False
-            user.is_staff = False
-            user.is_superuser = False
-            user.first_name = name
-            for permission in permission_list:
-                group = Group.objects.get(name=permission)
-                user.groups.add(group)
-            user.save()
+            with transaction.atomic():
+                user = User.objects.create_user(user_id, email, password)
+                user.is_active = True if user_status == '활성화' else False
+                user.is_staff = False
+                user.is_superuser = False
+                user.first_name = name
+                user.save()
+                user.groups.set(groups)
+            object_id = user.id
             result = True
 
             return Response({
@@ -131,7 +138,7 @@ class UsersAPI(viewsets.ModelViewSet):
                 'name': user.first_name,
                 'email': user.email,
                 'status': '활성화' if user.is_active else '비활성화',
-                'permission': list(Group.objects.filter(user__id=user.id).values_list('name', flat=True)),
+                'permission': [group.name for group in groups],
                 'created_at': user.date_joined,
             }, status=status.HTTP_201_CREATED)
 
@@ -148,18 +155,28 @@ class UsersAPI(viewsets.ModelViewSet):
             actions.append(f'[권한] : {permission}')
             audit_log = f"""사용자 생성 ( {', '.join(actions)} )"""
 
-            insert_audit_log(request.user.username, get_client_ip(request), category, sub_category, audit_log, result)
+            changes['username'] = {'before': None, 'after': user_id}
+            changes['first_name'] = {'before': None, 'after': name}
+            changes['email'] = {'before': None, 'after': email}
+            changes['is_active'] = {'before': None, 'after': user_status}
+            changes['groups'] = {'before': None, 'after': permission}
+
+            insert_audit_log(
+                get_audit_context(request), category, sub_category, audit_log, result,
+                object_type=ChoiceObjectType.USER, object_id=object_id, changes=changes,
+            )
 
     def update(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 변경 내역
         actions = []
         actions.append(f"""[아이디] : {get_dic_value(kwargs, 'pk')}""")
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
 
         try:
-            user = User.objects.get(id=kwargs['pk']) if User.objects.filter(id=kwargs['pk']).exists() else None
+            user = User.objects.filter(id=kwargs['pk']).prefetch_related('groups').first()
             if not user:
                 return Response({'user_id': message.not_found}, status=status.HTTP_404_NOT_FOUND)
 
@@ -178,18 +195,21 @@ class UsersAPI(viewsets.ModelViewSet):
             if name and user.first_name != name:
                 # 감사 로그 > 내용 추가
                 actions.append(f"[이름] : {user.first_name} → {name}")
+                changes['first_name'] = {'before': user.first_name, 'after': name}
 
                 user.first_name = name
 
             if password:
                 # 감사 로그 > 내용 추가
                 actions.append(f"[패스워드 변경]")
+                changes['password'] = {'changed': True}
 
                 user.set_password(password)
 
             if email and user.email != email:
                 # 감사 로그 > 내용 추가
                 actions.append(f"[이메일] : {user.email} → {email}")
+                changes['email'] = {'before': user.email, 'after': email}
 
                 user.email = email
 
@@ -199,22 +219,25 @@ class UsersAPI(viewsets.ModelViewSet):
 
                 # 감사 로그 > 내용 추가
                 actions.append(f"[상태] : {org_user_status} → {user_status}")
+                changes['is_active'] = {'before': org_user_status, 'after': user_status}
 
                 user.is_active = is_active
 
-            # 권한 변경 추가 필요
-            org_permission_list = sorted(list(Group.objects.filter(user__id=user.id).values_list('name', flat=True)))
+            # 권한 변경
+            org_permission_list = sorted(group.name for group in user.groups.all())
+            new_permission_list = org_permission_list
             if org_permission_list != permission_list:
-                # 감사 로그 > 내용 추가
-                actions.append(f"[권한] : {', '.join(org_permission_list)} → {', '.join(permission_list)}")
+                groups = get_groups(permission_list)
+                new_permission_list = [group.name for group in groups]
 
-                with transaction.atomic():
-                    user.groups.clear()
-                    for permission in permission_list:
-                        group = Group.objects.get(name=permission)
-                        user.groups.add(group)
+                # 감사 로그 > 내용 추가
+                actions.append(f"[권한] : {', '.join(org_permission_list)} → {', '.join(new_permission_list)}")
+                changes['groups'] = {'before': org_permission_list, 'after': new_permission_list}
 
-            user.save()
+            with transaction.atomic():
+                if new_permission_list != org_permission_list:
+                    user.groups.set(groups)
+                user.save()
             result = True
 
             return Response({
@@ -223,7 +246,7 @@ class UsersAPI(viewsets.ModelViewSet):
                 'name': user.first_name,
                 'email': user.email,
                 'status': '활성화' if user.is_active else '비활성화',
-                'permission': list(Group.objects.filter(user__id=user.id).values_list('name', flat=True)),
+                'permission': new_permission_list,
                 'created_at': user.date_joined,
                 'last_login': user.last_login,
             }, status=status.HTTP_200_OK)
@@ -235,18 +258,22 @@ class UsersAPI(viewsets.ModelViewSet):
         finally:
             # 감사 로그 기록
             audit_log = f"""사용자 편집 ( {', '.join(actions)} )"""
-            insert_audit_log(request.user.username, get_client_ip(request), category, sub_category, audit_log, result)
+            insert_audit_log(
+                get_audit_context(request), category, sub_category, audit_log, result,
+                object_type=ChoiceObjectType.USER, object_id=get_dic_value(kwargs, 'pk'), changes=changes,
+            )
 
     def destroy(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 변경 내역
         actions = []
         actions.append(f"""[아이디] : {get_dic_value(kwargs, 'pk')}""")
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
 
         try:
-            user = User.objects.get(id=kwargs['pk']) if User.objects.filter(id=kwargs['pk']).exists() else None
+            user = User.objects.filter(id=kwargs['pk']).prefetch_related('groups').first()
             if not user:
                 return Response({'user_id': message.not_found}, status=status.HTTP_404_NOT_FOUND)
 
@@ -254,7 +281,14 @@ class UsersAPI(viewsets.ModelViewSet):
             actions.append(f"""[이름] : {user.first_name}""")
             actions.append(f"""[이메일] : {user.email}""")
             actions.append(f"""[상태] : {'활성화' if user.is_active is True else '비활성화'}""")
-            actions.append(f"""[권한] : {list(Group.objects.filter(user__id=user.id).values_list('name', flat=True))}""")
+            permission_list = [group.name for group in user.groups.all()]
+            actions.append(f"""[권한] : {permission_list}""")
+
+            changes['username'] = {'before': user.username, 'after': None}
+            changes['first_name'] = {'before': user.first_name, 'after': None}
+            changes['email'] = {'before': user.email, 'after': None}
+            changes['is_active'] = {'before': '활성화' if user.is_active is True else '비활성화', 'after': None}
+            changes['groups'] = {'before': permission_list, 'after': None}
 
             if user == request.user:
                 return Response('본인의 계정은 삭제할 수 없습니다.', status=status.HTTP_400_BAD_REQUEST)
@@ -270,4 +304,7 @@ class UsersAPI(viewsets.ModelViewSet):
         finally:
             # 감사 로그 기록
             audit_log = f"""사용자 삭제 ( {', '.join(actions)} )"""
-            insert_audit_log(request.user.username, get_client_ip(request), category, sub_category, audit_log, result)
+            insert_audit_log(
+                get_audit_context(request), category, sub_category, audit_log, result,
+                object_type=ChoiceObjectType.USER, object_id=get_dic_value(kwargs, 'pk'), changes=changes,
+            )
@@ -1,24 +1,124 @@
-import ipaddress
+import csv
+import io
+import json
 import logging
+import zlib
+from datetime import datetime
 
+from django.db.models import Q, Sum
+from django.http import StreamingHttpResponse
 from django_filters import rest_framework as filters
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
 
-from utils.format_helper import to_int
-from utils.regex_helper import ip_cidr_regex
-from api.models import ChoiceResult, choice_str_to_int, AuditLog
+from utils.format_helper import bytes_to_ip, datetime_to_str
+from utils.network_helper import get_ip_range_bytes
+from utils.search_helper import search_audit_log
+from api.models import ChoiceObjectType, ChoiceResult, choice_str_to_int, AuditLog, AuditLogStat
 from api.permissions import PermissionAdmin
 from api.serializers import AuditLogSerializer
+from config.paginations import CustomCursorPagination, EstimatedCount
 
 logger = logging.getLogger(__name__)
 
 
+# 내보내기 : 한 번에 조회할 건수, 컬럼, 형식 별 Content-Type, 결과 표시 값
+EXPORT_BATCH_SIZE = 2000
+EXPORT_COLUMNS = (
+    "id",
+    "user",
+    "ip",
+    "category",
+    "sub_category",
+    "action",
+    "result",
+    "object_type",
+    "object_id",
+    "changes",
+    "date",
+)
+EXPORT_CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+EXPORT_RESULT_NAMES = dict(ChoiceResult.choices)
+
+# 통계 : 묶음 기준으로 사용할 수 있는 필드
+STAT_GROUP_FIELDS = ("day", "category", "sub_category", "result", "user")
+
+
+# (date, id) 순으로 이전 배치의 마지막 위치 이후를 조회 (MySQL은 iterator()도 결과 전체를 클라이언트에 적재하므로 배치로 조회)
+def iter_export_rows(queryset, batch_size=EXPORT_BATCH_SIZE):
+    queryset = queryset.order_by("date", "id").values_list(*EXPORT_COLUMNS)
+
+    last_row = None
+    while True:
+        batch = queryset
+        if last_row is not None:
+            last_date, last_id = last_row[-1], last_row[0]
+            batch = batch.filter(Q(date__gt=last_date) | Q(date=last_date, id__gt=last_id))
+
+        rows = list(batch[:batch_size])
+        if not rows:
+            break
+
+        yield rows
+        last_row = rows[-1]
+
+
+# 직렬화 객체 없이 행 단위로 IP, 결과, 일시 변환
+def format_export_row(row):
+    data = dict(zip(EXPORT_COLUMNS, row))
+    data["ip"] = bytes_to_ip(data["ip"]) if data["ip"] else None
+    data["result"] = EXPORT_RESULT_NAMES.get(data["result"])
+    data["date"] = datetime_to_str(data["date"], "%Y-%m-%d %H:%M:%S")
+
+    return data
+
+
+def iter_export(queryset, file_format, use_gzip):
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if use_gzip else None
+
+    def encode(text):
+        data = text.encode("utf-8")
+        return compressor.compress(data) if compressor else data
+
+    if file_format == "csv":
+        # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+        buffer = io.StringIO()
+        buffer.write("\ufeff")
+        csv.writer(buffer).writerow(EXPORT_COLUMNS)
+        yield encode(buffer.getvalue())
+
+    for rows in iter_export_rows(queryset):
+        buffer = io.StringIO()
+
+        if file_format == "csv":
+            writer = csv.writer(buffer)
+            for row in rows:
+                data = format_export_row(row)
+                if data["changes"] is not None:
+                    data["changes"] = json.dumps(data["changes"], ensure_ascii=False)
+                writer.writerow([data[column] for column in EXPORT_COLUMNS])
+
+        else:
+            for row in rows:
+                buffer.write(json.dumps(format_export_row(row), ensure_ascii=False) + "\n")
+
+        chunk = encode(buffer.getvalue())
+        if chunk:
+            yield chunk
+
+    if compressor:
+        yield compressor.flush()
+
+
 class AuditLogFilter(filters.FilterSet):
     result_list = [
         list(reversed(choice_result)) for choice_result in list(ChoiceResult.choices)
     ]
 
-    user = filters.CharFilter(lookup_expr="icontains")
+    # 인덱스(user, date)를 사용할 수 있도록 앞부분 일치로 검색
+    user = filters.CharFilter(lookup_expr="istartswith", help_text="Prefix match (case-insensitive)")
     ip = filters.CharFilter(method="ip_range_filter")
     result = filters.ChoiceFilter(
         choices=result_list,
@@ -27,21 +127,26 @@ class AuditLogFilter(filters.FilterSet):
     )
 
     def ip_range_filter(self, queryset, name, value):
-        # IP 주소 또는 CIDR 형태인 경우 (192.168.0.1 OR 192.168.0.1/24)
-        if ip_cidr_regex.match(value):
-            ip_addr = ipaddress.ip_network(value, False)
-
-            start_ip = to_int(ip_addr.network_address)
-            end_ip = to_int(ip_addr.broadcast_address)
+        # IP 주소 또는 CIDR 형태인 경우 (IPv4, IPv6 모두 16바이트 범위 검색)
+        ip_range = get_ip_range_bytes(value)
+        if ip_range is None:
+            return queryset.none()
 
-            return queryset.filter(ip__gte=start_ip, ip__lte=end_ip)
+        start_ip, end_ip = ip_range
+        if start_ip == end_ip:
+            return queryset.filter(ip=start_ip)
 
-        else:
-            return queryset.filter(ip=value)
+        return queryset.filter(ip__gte=start_ip, ip__lte=end_ip)
 
     def result_filter(self, queryset, name, value):
         return queryset.filter(result=choice_str_to_int(ChoiceResult, value))
 
+    # 내용 전문 검색 (기본 정렬 : 관련도 순, ordering 파라미터로 발생 일시 순 정렬 가능)
+    q = filters.CharFilter(method="action_search_filter")
+
+    def action_search_filter(self, queryset, name, value):
+        return search_audit_log(queryset, value).order_by("-relevance", "-id")
+
     start_date = filters.DateTimeFilter(field_name="date", lookup_expr="gte")
     end_date = filters.DateTimeFilter(field_name="date", lookup_expr="lte")
 
@@ -69,14 +174,40 @@ class AuditLogFilter(filters.FilterSet):
             "sub_category",
             "action",
             "result",
+            "object_type",
+            "object_id",
             "start_date",
             "end_date",
         )
 
 
+class AuditLogStatFilter(filters.FilterSet):
+    result = filters.ChoiceFilter(
+        choices=AuditLogFilter.result_list,
+        method="result_filter",
+        help_text=f'Available values : {", ".join(list(zip(*ChoiceResult.choices))[1])}',
+    )
+
+    def result_filter(self, queryset, name, value):
+        return queryset.filter(result=choice_str_to_int(ChoiceResult, value))
+
+    start_date = filters.DateFilter(field_name="day", lookup_expr="gte")
+    end_date = filters.DateFilter(field_name="day", lookup_expr="lte")
+
+    class Meta:
+        model = AuditLogStat
+        fields = ("category", "sub_category", "result", "user", "start_date", "end_date")
+
+
+class AuditLogPagination(CustomCursorPagination):
+    # 첫 페이지 전체 건수 : 대용량 테이블이므로 추정 건수가 기준(PAGINATION_COUNT_ESTIMATE_THRESHOLD) 이상이면 COUNT(*) 없이 MySQL 추정치 사용
+    count_strategy = EstimatedCount()
+
+
 class AuditLogAPI(viewsets.ModelViewSet):
     serializer_class = AuditLogSerializer
-    queryset = AuditLog.objects.all()
+    # 기본 정렬 : 발생 일시 순 (date, id) - 검색 조건 별 인덱스가 date 로 끝나므로 별도 정렬 없이 인덱스 순서로 조회
+    queryset = AuditLog.objects.order_by("date")
     permission_classes = [PermissionAdmin]
 
     # 지원 HTTP 메소드 설정 (CRUD)
@@ -85,6 +216,9 @@ class AuditLogAPI(viewsets.ModelViewSet):
     # 커스텀 필터 클래스 적용
     filterset_class = AuditLogFilter
 
+    # 커서 기반 페이지네이션 적용 (대량 데이터의 뒤쪽 페이지 조회 시 OFFSET, COUNT(*) 비용 제거)
+    pagination_class = AuditLogPagination
+
     # 필터 적용 필드 (커스텀 필터 클래스를 적용하지 않는 경우 사용)
     # filterset_fields = ('id', 'user', 'ip', 'category', 'sub_category', 'action', 'result', 'date')
 
@@ -110,4 +244,78 @@ class AuditLogAPI(viewsets.ModelViewSet):
     #     "action",
     #     "result",
     #     "date",
-    # )
\ No newline at end of file
+    # )
+
+    # 대상 객체의 감사 로그 이력 (인덱스(object_type, object_id, date)로 조회, 최신 순)
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"history/(?P<object_type>[a-z_]+)/(?P<object_id>[0-9]+)",
+    )
+    def history(self, request, object_type, object_id, *args, **kwargs):
+        if object_type not in ChoiceObjectType.values:
+            raise NotFound()
+
+        queryset = self.filter_queryset(
+            self.get_queryset().filter(object_type=object_type, object_id=object_id)
+        )
+        # 정렬 파라미터(ordering) 또는 검색(q)으로 정렬이 바뀌지 않은 경우 최근 변경 순
+        if queryset.query.order_by == self.queryset.query.order_by:
+            queryset = queryset.order_by("-date", "-id")
+
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    # 감사 로그 내보내기 (AuditLogFilter 조건 적용, NDJSON/CSV 스트리밍, gzip 압축 선택)
+    # 파라미터 : file_format=ndjson|csv, gzip=true
+    @action(detail=False, methods=["get"])
+    def export(self, request, *args, **kwargs):
+        file_format = request.query_params.get("file_format", "ndjson")
+        if file_format not in EXPORT_CONTENT_TYPES:
+            raise ValidationError(
+                {"file_format": [f'Available values : {", ".join(EXPORT_CONTENT_TYPES)}']}
+            )
+
+        use_gzip = request.query_params.get("gzip", "").lower() in ("1", "true", "y")
+        queryset = self.filter_queryset(self.get_queryset())
+
+        filename = f"audit_log_{datetime.now():%Y%m%d%H%M%S}.{file_format}"
+        if use_gzip:
+            filename += ".gz"
+            content_type = "application/gzip"
+        else:
+            content_type = f"{EXPORT_CONTENT_TYPES[file_format]}; charset=utf-8"
+
+        response = StreamingHttpResponse(
+            iter_export(queryset, file_format, use_gzip), content_type=content_type
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    # 감사 로그 통계 (일 단위 집계 테이블만 조회)
+    # 파라미터 : group_by=day,category,sub_category,result,user 중 선택 (기본 값 : day) 및 AuditLogStatFilter 조건
+    @action(detail=False, methods=["get"])
+    def stats(self, request, *args, **kwargs):
+        group_by = [field for field in request.query_params.get("group_by", "day").split(",") if field]
+        if not group_by or any(field not in STAT_GROUP_FIELDS for field in group_by):
+            raise ValidationError(
+                {"group_by": [f'Available values : {", ".join(STAT_GROUP_FIELDS)}']}
+            )
+
+        filterset = AuditLogStatFilter(
+            request.query_params, queryset=AuditLogStat.objects.all(), request=request
+        )
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        rows = list(
+            filterset.qs.values(*group_by).annotate(count=Sum("count")).order_by(*group_by)
+        )
+        for row in rows:
+            if "day" in row:
+                row["day"] = datetime_to_str(row["day"], "%Y-%m-%d")
+            if "result" in row:
+                row["result"] = EXPORT_RESULT_NAMES.get(row["result"])
+
+        return Response({"results": rows})
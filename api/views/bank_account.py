@@ -1,14 +1,17 @@
 import logging
 
+from django.db import transaction
 from django_filters import rest_framework as filters
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 
-from utils.aes_helper import make_enc_value, get_dec_value
+from utils.aes_helper import make_blind_index
 from utils.dic_helper import get_dic_value
 from utils.format_helper import to_str
-from utils.log_helper import insert_audit_log
-from api.models import BankAccount
+from utils.log_helper import insert_audit_log, get_audit_context
+from utils.search_helper import search_contains, validate_search_keyword, update_search_index, delete_search_index
+from utils.stat_helper import update_user_stat
+from api.models import BankAccount, ChoiceObjectType, SEARCH_FIELDS
 from api.permissions import PermissionUser
 from api.serializers import BankAccountSerializer
 
@@ -22,13 +25,13 @@ class BankAccountFilter(filters.FilterSet):
     bank = filters.CharFilter(lookup_expr="icontains")
     account = filters.CharFilter(method="enc_account_filter")
     account_holder = filters.CharFilter(lookup_expr="icontains")
-    description = filters.CharFilter(method="enc_description_filter")
+    description = filters.CharFilter(method="enc_description_filter", validators=[validate_search_keyword])
 
     def enc_account_filter(self, queryset, name, value):
-        return queryset.filter(account=make_enc_value(value))
+        return queryset.filter(account_bidx=make_blind_index(value))
 
     def enc_description_filter(self, queryset, name, value):
-        return queryset.filter(description=make_enc_value(value))
+        return search_contains(queryset, self.request.user, "description", value)
 
     # 정렬 적용 필드 : (실제 필드, 파라미터 명)으로 기재
     ordering = filters.OrderingFilter(
@@ -63,29 +66,33 @@ class BankAccountAPI(viewsets.ModelViewSet):
         # 인증된 사용자에 대해 필터링
         return super().get_queryset().filter(user=self.request.user)
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            instance = serializer.save(user=self.request.user)
+            update_search_index(instance)
+            update_user_stat(instance, 1)
 
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            for data in serializer.data:
-                if data.get("account"):
-                    data["account"] = get_dec_value(data.get("account"))
+    def perform_update(self, serializer):
+        org_values = [getattr(serializer.instance, field) for field in SEARCH_FIELDS[BankAccount]]
 
-                if data.get("description"):
-                    data["description"] = get_dec_value(data.get("description"))
-            return self.get_paginated_response(serializer.data)
+        with transaction.atomic():
+            instance = serializer.save()
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+            # 검색 대상 필드가 변경된 경우에만 토큰 재생성
+            if org_values != [getattr(instance, field) for field in SEARCH_FIELDS[BankAccount]]:
+                update_search_index(instance)
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            delete_search_index(instance)
+            instance.delete()
+            update_user_stat(instance, -1)
 
     def create(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 대상 아이디, 변경 내역
         actions = []
+        object_id = None
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
@@ -94,21 +101,14 @@ class BankAccountAPI(viewsets.ModelViewSet):
             bank = get_dic_value(request.data, "bank")
             account_holder = get_dic_value(request.data, "account_holder")
 
-            if request.data.get("account"):
-                request.data["account"] = make_enc_value(request.data.get("account"))
-
-            if request.data.get("description"):
-                request.data["description"] = make_enc_value(
-                    request.data.get("description")
-                )
-
             serializer = self.get_serializer(data=request.data)
             serializer.is_valid(raise_exception=True)
             self.perform_create(serializer)
             headers = self.get_success_headers(serializer.data)
 
             # 추가 성공 시 감사 로그 > 내용에 아이디 항목 추가
-            actions.append(f'[아이디] : {to_str(serializer.data.get("id"))}')
+            object_id = serializer.data.get("id")
+            actions.append(f'[아이디] : {to_str(object_id)}')
 
             result = True
             return Response(
@@ -123,29 +123,31 @@ class BankAccountAPI(viewsets.ModelViewSet):
             # 감사 로그 기록
             actions.append(f"[은행] : {bank}")
             actions.append(f"[예금주] : {account_holder}")
+            changes["bank"] = {"before": None, "after": bank}
+            changes["account_holder"] = {"before": None, "after": account_holder}
             audit_log = f"""추가 ( {', '.join(actions)} )"""
 
             insert_audit_log(
-                request.user.username, request, category, "-", audit_log, result
+                get_audit_context(request),
+                category,
+                "-",
+                audit_log,
+                result,
+                object_type=ChoiceObjectType.BANK_ACCOUNT,
+                object_id=object_id,
+                changes=changes,
             )
 
     def update(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 변경 내역
         actions = []
         actions.append(f"""[아이디] : {get_dic_value(kwargs, 'pk')}""")
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
 
         try:
-            if request.data.get("account"):
-                request.data["account"] = make_enc_value(request.data.get("account"))
-
-            if request.data.get("description"):
-                request.data["description"] = make_enc_value(
-                    request.data.get("description")
-                )
-
             bank = get_dic_value(request.data, "bank")
             account_holder = get_dic_value(request.data, "account_holder")
 
@@ -155,23 +157,29 @@ class BankAccountAPI(viewsets.ModelViewSet):
             if instance.bank != bank:
                 # 감사 로그 > 내용 추가
                 actions.append(f"[은행] {instance.bank} → {bank}")
-
-            if instance.account != get_dic_value(request.data, "account"):
-                # 감사 로그 > 내용 추가
-                actions.append(f"[계좌번호 변경]")
+                changes["bank"] = {"before": instance.bank, "after": bank}
 
             if instance.account_holder != account_holder:
                 # 감사 로그 > 내용 추가
                 actions.append(f"[예금주] {instance.account_holder} → {account_holder}")
-
-            if instance.description != get_dic_value(request.data, "description"):
-                # 감사 로그 > 내용 추가
-                actions.append(f"[설명 변경]")
+                changes["account_holder"] = {"before": instance.account_holder, "after": account_holder}
 
             serializer = self.get_serializer(
                 instance, data=request.data, partial=partial
             )
             serializer.is_valid(raise_exception=True)
+
+            # 암호화 필드는 검증 후 암호문끼리 비교
+            if instance.account != serializer.validated_data.get("account"):
+                # 감사 로그 > 내용 추가
+                actions.append(f"[계좌번호 변경]")
+                changes["account"] = {"changed": True}
+
+            if instance.description != serializer.validated_data.get("description"):
+                # 감사 로그 > 내용 추가
+                actions.append(f"[설명 변경]")
+                changes["description"] = {"changed": True}
+
             self.perform_update(serializer)
 
             if getattr(instance, "_prefetched_objects_cache", None):
@@ -190,13 +198,21 @@ class BankAccountAPI(viewsets.ModelViewSet):
             # 감사 로그 기록
             audit_log = f"""편집 ( {', '.join(actions)} )"""
             insert_audit_log(
-                request.user.username, request, category, "-", audit_log, result
+                get_audit_context(request),
+                category,
+                "-",
+                audit_log,
+                result,
+                object_type=ChoiceObjectType.BANK_ACCOUNT,
+                object_id=get_dic_value(kwargs, "pk"),
+                changes=changes,
             )
 
     def destroy(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 변경 내역
         actions = []
         actions.append(f"""[아이디] : {get_dic_value(kwargs, 'pk')}""")
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
@@ -205,6 +221,8 @@ class BankAccountAPI(viewsets.ModelViewSet):
             instance = self.get_object()
             actions.append(f"[은행] : {to_str(instance.bank)}")
             actions.append(f"[예금주] : {to_str(instance.account_holder)}")
+            changes["bank"] = {"before": instance.bank, "after": None}
+            changes["account_holder"] = {"before": instance.account_holder, "after": None}
 
             self.perform_destroy(instance)
 
@@ -220,5 +238,12 @@ class BankAccountAPI(viewsets.ModelViewSet):
             audit_log = f"""삭제 ( {', '.join(actions)} )"""
 
             insert_audit_log(
-                request.user.username, request, category, "-", audit_log, result
+                get_audit_context(request),
+                category,
+                "-",
+                audit_log,
+                result,
+                object_type=ChoiceObjectType.BANK_ACCOUNT,
+                object_id=get_dic_value(kwargs, "pk"),
+                changes=changes,
             )
@@ -3,7 +3,7 @@ import logging
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 
-from api.models import BankAccount, GuestBook, Note, Serial
+from utils.stat_helper import get_user_stat
 from api.permissions import PermissionUser
 from api.serializers import DashboardStatsSerializer
 
@@ -15,11 +15,7 @@ class DashboardStatsAPI(viewsets.ViewSet):
     serializer_class = DashboardStatsSerializer
 
     def list(self, request, *args, **kwargs):
-        data = {
-            "bank_account_count": BankAccount.objects.count(),
-            "guest_book_count": GuestBook.objects.count(),
-            "note_count": Note.objects.count(),
-            "serial_count": Serial.objects.count(),
-        }
+        # 항목 추가/삭제 시 함께 갱신되는 사용자 통계를 기본 키로 조회
+        serializer = self.serializer_class(get_user_stat(request.user.pk))
 
-        return Response(data, status=status.HTTP_200_OK)
+        return Response(serializer.data, status=status.HTTP_200_OK)
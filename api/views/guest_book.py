@@ -1,13 +1,15 @@
 import logging
 
+from django.db import transaction
 from django_filters import rest_framework as filters
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 
 from utils.dic_helper import get_dic_value
 from utils.format_helper import to_str, to_int, datetime_to_str
-from utils.log_helper import insert_audit_log
-from api.models import GuestBook
+from utils.log_helper import insert_audit_log, get_audit_context
+from utils.stat_helper import update_user_stat
+from api.models import ChoiceObjectType, GuestBook
 from api.permissions import PermissionUser
 from api.serializers import GuestBookSerializer
 
@@ -72,11 +74,20 @@ class GuestBookAPI(viewsets.ModelViewSet):
         return super().get_queryset().filter(user=self.request.user)
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        with transaction.atomic():
+            instance = serializer.save(user=self.request.user)
+            update_user_stat(instance, 1)
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            instance.delete()
+            update_user_stat(instance, -1)
 
     def create(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 대상 아이디, 변경 내역
         actions = []
+        object_id = None
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
@@ -100,7 +111,8 @@ class GuestBookAPI(viewsets.ModelViewSet):
             headers = self.get_success_headers(serializer.data)
 
             # 추가 성공 시 감사 로그 > 내용에 아이디 항목 추가
-            actions.append(f'[아이디] : {to_str(serializer.data.get("id"))}')
+            object_id = serializer.data.get("id")
+            actions.append(f'[아이디] : {to_str(object_id)}')
 
             result = True
             return Response(
@@ -124,14 +136,29 @@ class GuestBookAPI(viewsets.ModelViewSet):
             actions.append(f"[설명] : {description}")
             audit_log = f"""추가 ( {', '.join(actions)} )"""
 
+            changes["name"] = {"before": None, "after": name}
+            changes["amount"] = {"before": None, "after": amount}
+            changes["date"] = {"before": None, "after": date}
+            changes["area"] = {"before": None, "after": area}
+            changes["attend"] = {"before": None, "after": attend}
+            changes["description"] = {"before": None, "after": description}
+
             insert_audit_log(
-                request.user.username, request, category, "-", audit_log, result
+                get_audit_context(request),
+                category,
+                "-",
+                audit_log,
+                result,
+                object_type=ChoiceObjectType.GUEST_BOOK,
+                object_id=object_id,
+                changes=changes,
             )
 
     def update(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 변경 내역
         actions = []
         actions.append(f"""[아이디] : {get_dic_value(kwargs, 'pk')}""")
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
@@ -155,6 +182,7 @@ class GuestBookAPI(viewsets.ModelViewSet):
             if instance.name != name:
                 # 감사 로그 > 내용 추가
                 actions.append(f"[이름] {instance.name} → {name}")
+                changes["name"] = {"before": instance.name, "after": name}
 
             if instance.amount != amount:
                 org_amount_str = instance.amount if instance.amount is not None else ""
@@ -162,26 +190,31 @@ class GuestBookAPI(viewsets.ModelViewSet):
 
                 # 감사 로그 > 내용 추가
                 actions.append(f"[금액] {org_amount_str} → {amount_str}")
+                changes["amount"] = {"before": instance.amount, "after": amount}
 
             org_date_str = datetime_to_str(instance.date, "%Y-%m-%d") if instance.date else ""
             date_str = date if date is not None else ""
             if org_date_str != date_str:
                 # 감사 로그 > 내용 추가
                 actions.append(f"[일자] {org_date_str} → {date_str}")
+                changes["date"] = {"before": org_date_str or None, "after": date}
 
             if instance.area != area:
                 # 감사 로그 > 내용 추가
                 actions.append(f"[장소] {instance.area} → {area}")
+                changes["area"] = {"before": instance.area, "after": area}
 
             if instance.attend != attend:
                 # 감사 로그 > 내용 추가
                 actions.append(
                     f"[참석 여부] {self.get_attend_str(instance.attend)} → {self.get_attend_str(attend)}"
                 )
+                changes["attend"] = {"before": instance.attend, "after": attend}
 
             if instance.description != get_dic_value(request.data, "description"):
                 # 감사 로그 > 내용 추가
                 actions.append(f"[설명] {instance.description} → {description}")
+                changes["description"] = {"before": instance.description, "after": description}
 
             serializer = self.get_serializer(
                 instance, data=request.data, partial=partial
@@ -205,13 +238,21 @@ class GuestBookAPI(viewsets.ModelViewSet):
             # 감사 로그 기록
             audit_log = f"""편집 ( {', '.join(actions)} )"""
             insert_audit_log(
-                request.user.username, request, category, "-", audit_log, result
+                get_audit_context(request),
+                category,
+                "-",
+                audit_log,
+                result,
+                object_type=ChoiceObjectType.GUEST_BOOK,
+                object_id=get_dic_value(kwargs, "pk"),
+                changes=changes,
             )
 
     def destroy(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 변경 내역
         actions = []
         actions.append(f"""[아이디] : {get_dic_value(kwargs, 'pk')}""")
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
@@ -229,6 +270,16 @@ class GuestBookAPI(viewsets.ModelViewSet):
             actions.append(f"[참석 여부] : {self.get_attend_str(instance.attend)}")
             actions.append(f"[설명] : {instance.description}")
 
+            changes["name"] = {"before": instance.name, "after": None}
+            changes["amount"] = {"before": instance.amount, "after": None}
+            changes["date"] = {
+                "before": datetime_to_str(instance.date, "%Y-%m-%d") if instance.date else None,
+                "after": None,
+            }
+            changes["area"] = {"before": instance.area, "after": None}
+            changes["attend"] = {"before": instance.attend, "after": None}
+            changes["description"] = {"before": instance.description, "after": None}
+
             self.perform_destroy(instance)
 
             result = True
@@ -243,7 +294,14 @@ class GuestBookAPI(viewsets.ModelViewSet):
             audit_log = f"""삭제 ( {', '.join(actions)} )"""
 
             insert_audit_log(
-                request.user.username, request, category, "-", audit_log, result
+                get_audit_context(request),
+                category,
+                "-",
+                audit_log,
+                result,
+                object_type=ChoiceObjectType.GUEST_BOOK,
+                object_id=get_dic_value(kwargs, "pk"),
+                changes=changes,
             )
 
     def get_attend_str(self, data):
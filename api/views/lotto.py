@@ -1,12 +1,12 @@
 import logging
 import random
 
-import requests
-from bs4 import BeautifulSoup
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 
 from utils.format_helper import to_str
+from utils.lotto_helper import get_lotto_stats
+from api import message
 from api.permissions import PermissionUser
 from api.serializers import LottoSerializer
 
@@ -20,35 +20,22 @@ class LottoAPI(viewsets.ModelViewSet):
     permission_classes = [PermissionUser]
 
     def list(self, request, *args, **kwargs):
-        data = self.gen_lotto_by_statistics()
+        # 번호 별 당첨 횟수 (캐시된 통계, 원격 조회 실패 시 이전 통계 또는 통계 파일 사용)
+        stats = get_lotto_stats()
+        if stats is None:
+            logger.warning("[LottoAPI - list] 번호 별 통계 없음 (원격 조회 실패, 통계 파일 없음)")
+            return Response({"detail": message.lotto_stats_unavailable}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        data = self.gen_lotto_by_statistics(stats)
         return Response(data, status=status.HTTP_200_OK)
 
-    def gen_lotto_by_statistics(self):
+    def gen_lotto_by_statistics(self, stats):
         result = []
 
         try:
-            base_url = "https://dhlottery.co.kr/gameResult.do?method=statByNumber"
-            con = requests.get(base_url)
-            soup = BeautifulSoup(con.content, "html.parser")
-            stats_table = soup.find("table", {"class": "tbl_data tbl_data_col"})
-
-            stats_list = []
             ball_list = []
 
-            for tr in stats_table.find_all("tr"):
-                ball_data = []
-                for td in tr.find_all("td"):
-                    data = td.get_text()
-                    if "\n\n" not in data:
-                        ball_data.append(int(data))
-
-                if ball_data:
-                    stats_list.append(ball_data)
-
-            for stats in stats_list:
-                number = stats[0]
-                count = stats[1]
-
+            for number, count in stats.items():
                 for i in range(count):
                     ball_list.append(number)
 
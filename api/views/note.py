@@ -1,14 +1,20 @@
 import logging
 
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from django_filters import rest_framework as filters
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from utils.aes_helper import make_enc_value, get_dec_value
+from utils.aes_helper import open_dec_stream
 from utils.dic_helper import get_dic_value
 from utils.format_helper import to_str
-from utils.log_helper import insert_audit_log
-from api.models import Note
+from utils.log_helper import insert_audit_log, get_audit_context
+from utils.search_helper import search_contains, validate_search_keyword, update_search_index, delete_search_index
+from utils.stat_helper import update_user_stat
+from api import message
+from api.models import ChoiceObjectType, Note, SEARCH_FIELDS
 from api.permissions import PermissionUser
 from api.serializers import NoteSerializer
 
@@ -20,10 +26,10 @@ category = "노트 관리"
 
 class NoteFilter(filters.FilterSet):
     title = filters.CharFilter(lookup_expr="icontains")
-    note = filters.CharFilter(method="enc_note_filter")
+    note = filters.CharFilter(method="enc_note_filter", validators=[validate_search_keyword])
 
     def enc_note_filter(self, queryset, name, value):
-        return queryset.filter(note=make_enc_value(value))
+        return search_contains(queryset, self.request.user, "note", value)
 
     start_date = filters.DateFilter(field_name="date", lookup_expr="gte")
     end_date = filters.DateFilter(field_name="date", lookup_expr="lte")
@@ -61,26 +67,50 @@ class NoteAPI(viewsets.ModelViewSet):
         # 인증된 사용자에 대해 필터링
         return super().get_queryset().filter(user=self.request.user)
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
+    # 노트 내용 다운로드 (청크 단위 복호화 후 스트리밍하여 노트 크기와 무관하게 메모리 사용량 유지)
+    # 키 버전 확인 및 첫 청크 복호화에 실패한 경우 응답 시작 전에 오류 반환
+    @action(detail=True, methods=["get"])
+    def download(self, request, *args, **kwargs):
+        instance = self.get_object()
 
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            for data in serializer.data:
-                if data.get("note"):
-                    data["note"] = get_dec_value(data.get("note"))
-            return self.get_paginated_response(serializer.data)
+        try:
+            chunks = open_dec_stream(instance.note)
+
+        except Exception as e:
+            logger.warning(f"[NoteAPI - download] {to_str(e)}")
+            return Response({"detail": message.decrypt_failed}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        response = StreamingHttpResponse(chunks, content_type="text/plain; charset=utf-8")
+        response["Content-Disposition"] = f'attachment; filename="note_{instance.id}.txt"'
+        return response
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        with transaction.atomic():
+            instance = serializer.save(user=self.request.user)
+            update_search_index(instance)
+            update_user_stat(instance, 1)
+
+    def perform_update(self, serializer):
+        org_values = [getattr(serializer.instance, field) for field in SEARCH_FIELDS[Note]]
+
+        with transaction.atomic():
+            instance = serializer.save()
+
+            # 검색 대상 필드가 변경된 경우에만 토큰 재생성
+            if org_values != [getattr(instance, field) for field in SEARCH_FIELDS[Note]]:
+                update_search_index(instance)
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            delete_search_index(instance)
+            instance.delete()
+            update_user_stat(instance, -1)
 
     def create(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 대상 아이디, 변경 내역
         actions = []
+        object_id = None
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
@@ -88,16 +118,14 @@ class NoteAPI(viewsets.ModelViewSet):
         try:
             title = get_dic_value(request.data, "title")
 
-            if request.data.get("note"):
-                request.data["note"] = make_enc_value(request.data.get("note"))
-
             serializer = self.get_serializer(data=request.data)
             serializer.is_valid(raise_exception=True)
             self.perform_create(serializer)
             headers = self.get_success_headers(serializer.data)
 
             # 추가 성공 시 감사 로그 > 내용에 아이디 항목 추가
-            actions.append(f'[아이디] : {to_str(serializer.data.get("id"))}')
+            object_id = serializer.data.get("id")
+            actions.append(f'[아이디] : {to_str(object_id)}')
 
             result = True
             return Response(
@@ -111,24 +139,30 @@ class NoteAPI(viewsets.ModelViewSet):
         finally:
             # 감사 로그 기록
             actions.append(f"[제목] : {title}")
+            changes["title"] = {"before": None, "after": title}
             audit_log = f"""추가 ( {', '.join(actions)} )"""
 
             insert_audit_log(
-                request.user.username, request, category, "-", audit_log, result
+                get_audit_context(request),
+                category,
+                "-",
+                audit_log,
+                result,
+                object_type=ChoiceObjectType.NOTE,
+                object_id=object_id,
+                changes=changes,
             )
 
     def update(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 변경 내역
         actions = []
         actions.append(f"""[아이디] : {get_dic_value(kwargs, 'pk')}""")
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
 
         try:
-            if request.data.get("note"):
-                request.data["note"] = make_enc_value(request.data.get("note"))
-
             title = get_dic_value(request.data, "title")
 
             partial = kwargs.pop("partial", False)
@@ -137,15 +171,19 @@ class NoteAPI(viewsets.ModelViewSet):
             if instance.title != title:
                 # 감사 로그 > 내용 추가
                 actions.append(f"[제목] {instance.title} → {title}")
-
-            if instance.note != get_dic_value(request.data, "note"):
-                # 감사 로그 > 내용 추가
-                actions.append(f"[내용 변경]")
+                changes["title"] = {"before": instance.title, "after": title}
 
             serializer = self.get_serializer(
                 instance, data=request.data, partial=partial
             )
             serializer.is_valid(raise_exception=True)
+
+            # 암호화 필드는 검증 후 암호문끼리 비교
+            if instance.note != serializer.validated_data.get("note"):
+                # 감사 로그 > 내용 추가
+                actions.append(f"[내용 변경]")
+                changes["note"] = {"changed": True}
+
             self.perform_update(serializer)
 
             if getattr(instance, "_prefetched_objects_cache", None):
@@ -164,13 +202,21 @@ class NoteAPI(viewsets.ModelViewSet):
             # 감사 로그 기록
             audit_log = f"""편집 ( {', '.join(actions)} )"""
             insert_audit_log(
-                request.user.username, request, category, "-", audit_log, result
+                get_audit_context(request),
+                category,
+                "-",
+                audit_log,
+                result,
+                object_type=ChoiceObjectType.NOTE,
+                object_id=get_dic_value(kwargs, "pk"),
+                changes=changes,
             )
 
     def destroy(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 변경 내역
         actions = []
         actions.append(f"""[아이디] : {get_dic_value(kwargs, 'pk')}""")
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
@@ -178,6 +224,7 @@ class NoteAPI(viewsets.ModelViewSet):
         try:
             instance = self.get_object()
             actions.append(f"[제목] : {to_str(instance.title)}")
+            changes["title"] = {"before": instance.title, "after": None}
 
             self.perform_destroy(instance)
 
@@ -193,5 +240,12 @@ class NoteAPI(viewsets.ModelViewSet):
             audit_log = f"""삭제 ( {', '.join(actions)} )"""
 
             insert_audit_log(
-                request.user.username, request, category, "-", audit_log, result
+                get_audit_context(request),
+                category,
+                "-",
+                audit_log,
+                result,
+                object_type=ChoiceObjectType.NOTE,
+                object_id=get_dic_value(kwargs, "pk"),
+                changes=changes,
             )
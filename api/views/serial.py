@@ -1,14 +1,17 @@
 import logging
 
+from django.db import transaction
 from django_filters import rest_framework as filters
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 
-from utils.aes_helper import make_enc_value, get_dec_value
+from utils.aes_helper import make_blind_index
 from utils.dic_helper import get_dic_value
 from utils.format_helper import to_str
-from utils.log_helper import insert_audit_log
-from api.models import Serial
+from utils.log_helper import insert_audit_log, get_audit_context
+from utils.search_helper import search_contains, validate_search_keyword, update_search_index, delete_search_index
+from utils.stat_helper import update_user_stat
+from api.models import ChoiceObjectType, Serial, SEARCH_FIELDS
 from api.permissions import PermissionUser
 from api.serializers import SerialSerializer
 
@@ -21,13 +24,13 @@ category = "시리얼 번호 관리"
 class SerialFilter(filters.FilterSet):
     title = filters.CharFilter(lookup_expr="icontains")
     value = filters.CharFilter(method="enc_value_filter")
-    description = filters.CharFilter(method="enc_description_filter")
+    description = filters.CharFilter(method="enc_description_filter", validators=[validate_search_keyword])
 
     def enc_value_filter(self, queryset, name, value):
-        return queryset.filter(value=make_enc_value(value))
+        return queryset.filter(value_bidx=make_blind_index(value))
 
     def enc_description_filter(self, queryset, name, value):
-        return queryset.filter(description=make_enc_value(value))
+        return search_contains(queryset, self.request.user, "description", value)
 
     # 정렬 적용 필드 : (실제 필드, 파라미터 명)으로 기재
     ordering = filters.OrderingFilter(
@@ -62,29 +65,33 @@ class SerialAPI(viewsets.ModelViewSet):
         # 인증된 사용자에 대해 필터링
         return super().get_queryset().filter(user=self.request.user)
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            instance = serializer.save(user=self.request.user)
+            update_search_index(instance)
+            update_user_stat(instance, 1)
 
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            for data in serializer.data:
-                if data.get("value"):
-                    data["value"] = get_dec_value(data.get("value"))
+    def perform_update(self, serializer):
+        org_values = [getattr(serializer.instance, field) for field in SEARCH_FIELDS[Serial]]
 
-                if data.get("description"):
-                    data["description"] = get_dec_value(data.get("description"))
-            return self.get_paginated_response(serializer.data)
+        with transaction.atomic():
+            instance = serializer.save()
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+            # 검색 대상 필드가 변경된 경우에만 토큰 재생성
+            if org_values != [getattr(instance, field) for field in SEARCH_FIELDS[Serial]]:
+                update_search_index(instance)
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            delete_search_index(instance)
+            instance.delete()
+            update_user_stat(instance, -1)
 
     def create(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 대상 아이디, 변경 내역
         actions = []
+        object_id = None
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
@@ -93,21 +100,14 @@ class SerialAPI(viewsets.ModelViewSet):
             serial_type = get_dic_value(request.data, "type")
             title = get_dic_value(request.data, "title")
 
-            if request.data.get("value"):
-                request.data["value"] = make_enc_value(request.data.get("value"))
-
-            if request.data.get("description"):
-                request.data["description"] = make_enc_value(
-                    request.data.get("description")
-                )
-
             serializer = self.get_serializer(data=request.data)
             serializer.is_valid(raise_exception=True)
             self.perform_create(serializer)
             headers = self.get_success_headers(serializer.data)
 
             # 추가 성공 시 감사 로그 > 내용에 아이디 항목 추가
-            actions.append(f'[아이디] : {to_str(serializer.data.get("id"))}')
+            object_id = serializer.data.get("id")
+            actions.append(f'[아이디] : {to_str(object_id)}')
 
             result = True
             return Response(
@@ -122,29 +122,31 @@ class SerialAPI(viewsets.ModelViewSet):
             # 감사 로그 기록
             actions.append(f"[유형] : {serial_type}")
             actions.append(f"[제품 명] : {title}")
+            changes["type"] = {"before": None, "after": serial_type}
+            changes["title"] = {"before": None, "after": title}
             audit_log = f"""추가 ( {', '.join(actions)} )"""
 
             insert_audit_log(
-                request.user.username, request, category, "-", audit_log, result
+                get_audit_context(request),
+                category,
+                "-",
+                audit_log,
+                result,
+                object_type=ChoiceObjectType.SERIAL,
+                object_id=object_id,
+                changes=changes,
             )
 
     def update(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 변경 내역
         actions = []
         actions.append(f"""[아이디] : {get_dic_value(kwargs, 'pk')}""")
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
 
         try:
-            if request.data.get("value"):
-                request.data["value"] = make_enc_value(request.data.get("value"))
-
-            if request.data.get("description"):
-                request.data["description"] = make_enc_value(
-                    request.data.get("description")
-                )
-
             serial_type = get_dic_value(request.data, "type")
             title = get_dic_value(request.data, "title")
 
@@ -154,23 +156,29 @@ class SerialAPI(viewsets.ModelViewSet):
             if instance.type != serial_type:
                 # 감사 로그 > 내용 추가
                 actions.append(f"[유형] {instance.type} → {serial_type}")
+                changes["type"] = {"before": instance.type, "after": serial_type}
 
             if instance.title != title:
                 # 감사 로그 > 내용 추가
                 actions.append(f"[제품 명] {instance.title} → {title}")
+                changes["title"] = {"before": instance.title, "after": title}
 
-            if instance.value != get_dic_value(request.data, "value"):
+            serializer = self.get_serializer(
+                instance, data=request.data, partial=partial
+            )
+            serializer.is_valid(raise_exception=True)
+
+            # 암호화 필드는 검증 후 암호문끼리 비교
+            if instance.value != serializer.validated_data.get("value"):
                 # 감사 로그 > 내용 추가
                 actions.append(f"[시리얼 번호 변경]")
+                changes["value"] = {"changed": True}
 
-            if instance.description != get_dic_value(request.data, "description"):
+            if instance.description != serializer.validated_data.get("description"):
                 # 감사 로그 > 내용 추가
                 actions.append(f"[설명 변경]")
+                changes["description"] = {"changed": True}
 
-            serializer = self.get_serializer(
-                instance, data=request.data, partial=partial
-            )
-            serializer.is_valid(raise_exception=True)
             self.perform_update(serializer)
 
             if getattr(instance, "_prefetched_objects_cache", None):
@@ -189,13 +197,21 @@ class SerialAPI(viewsets.ModelViewSet):
             # 감사 로그 기록
             audit_log = f"""편집 ( {', '.join(actions)} )"""
             insert_audit_log(
-                request.user.username, request, category, "-", audit_log, result
+                get_audit_context(request),
+                category,
+                "-",
+                audit_log,
+                result,
+                object_type=ChoiceObjectType.SERIAL,
+                object_id=get_dic_value(kwargs, "pk"),
+                changes=changes,
             )
 
     def destroy(self, request, *args, **kwargs):
-        # 감사 로그 > 내용
+        # 감사 로그 > 내용, 변경 내역
         actions = []
         actions.append(f"""[아이디] : {get_dic_value(kwargs, 'pk')}""")
+        changes = {}
 
         # 감사 로그 > 결과
         result = False
@@ -204,6 +220,8 @@ class SerialAPI(viewsets.ModelViewSet):
             instance = self.get_object()
             actions.append(f"[유형] : {to_str(instance.type)}")
             actions.append(f"[제품 명] : {to_str(instance.title)}")
+            changes["type"] = {"before": instance.type, "after": None}
+            changes["title"] = {"before": instance.title, "after": None}
 
             self.perform_destroy(instance)
 
@@ -219,5 +237,12 @@ class SerialAPI(viewsets.ModelViewSet):
             audit_log = f"""삭제 ( {', '.join(actions)} )"""
 
             insert_audit_log(
-                request.user.username, request, category, "-", audit_log, result
+                get_audit_context(request),
+                category,
+                "-",
+                audit_log,
+                result,
+                object_type=ChoiceObjectType.SERIAL,
+                object_id=get_dic_value(kwargs, "pk"),
+                changes=changes,
             )
@@ -0,0 +1,18 @@
+from utils.log_helper import get_audit_context
+
+
+class AuditContextMiddleware(object):
+    """
+    요청 당 1회 클라이언트 IP, 요청 아이디를 계산하여 request.audit_context에 연결
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        context = get_audit_context(request)
+
+        response = self.get_response(request)
+        response["X-Request-ID"] = context.request_id
+
+        return response
@@ -1,17 +1,448 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import functools
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db import connections
+from django.db.models import F, Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from utils.format_helper import to_str
+
+logger = logging.getLogger(__name__)
+
+
+class ExactCount(object):
+    """
+    전체 건수 계산 방식 : 매 요청마다 COUNT(*)로 정확한 건수 계산
+    count()는 (건수, 정확한 건수 여부)를 반환
+    """
+
+    def count(self, queryset, request):
+        return queryset.count(), True
+
+
+class CachedCount(ExactCount):
+    """
+    (사용자, 요청 경로, 필터 파라미터) 별로 계산한 건수를 일정 시간 캐시
+    캐시된 건수는 그 사이 추가/삭제된 데이터가 반영되지 않으므로 정확한 건수가 아닌 것으로 표시
+    """
+
+    # 건수 계산과 무관한 파라미터 (페이지 이동 시 캐시 재사용)
+    ignore_query_params = ('page', 'page_size', 'cursor')
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout if timeout is not None else settings.PAGINATION_COUNT_CACHE_TIMEOUT
+
+    def get_cache_key(self, queryset, request):
+        user = getattr(request, 'user', None)
+        user_key = user.pk if user is not None and user.is_authenticated else ''
+
+        params = sorted(
+            (key, value)
+            for key, values in request.query_params.lists()
+            if key not in self.ignore_query_params
+            for value in values
+        )
+        digest = hashlib.sha256(json.dumps([request.path, params]).encode('utf-8')).hexdigest()
+
+        return f'pagination_count:{queryset.model._meta.label_lower}:{user_key}:{digest}'
+
+    def count(self, queryset, request):
+        cache_key = self.get_cache_key(queryset, request)
+
+        count = cache.get(cache_key)
+        if count is not None:
+            return count, False
+
+        count, exact = super().count(queryset, request)
+        cache.set(cache_key, count, self.timeout)
+
+        return count, exact
+
+
+class EstimatedCount(ExactCount):
+    """
+    MySQL 통계 정보로 건수를 추정하고, 추정 건수가 기준 이상인 경우 COUNT(*) 없이 추정 건수 반환
+    - 필터가 없는 경우 : information_schema.TABLES 의 TABLE_ROWS
+    - 필터가 있는 경우 : EXPLAIN 의 rows * filtered 추정치
+    추정 건수가 기준 미만이거나 추정할 수 없는 경우 (MySQL 외 DB) 정확한 건수 계산
+    추정을 위해 목록 요청마다 조회(information_schema 또는 EXPLAIN) 1회가 추가되며,
+    추정 건수가 기준 미만인 경우 COUNT(*)까지 2회 조회하므로 대부분 기준 이상인 대용량 목록에만 사용
+    """
+
+    def __init__(self, threshold=None):
+        self.threshold = threshold if threshold is not None else settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD
+
+    def count(self, queryset, request):
+        estimate = self.estimate(queryset)
+        if estimate is not None and estimate >= self.threshold:
+            return estimate, False
+
+        return super().count(queryset, request)
+
+    def estimate(self, queryset):
+        try:
+            result = None
+
+            connection = connections[queryset.db]
+            if connection.vendor != 'mysql':
+                return result
+
+            queryset = queryset.order_by()
+            with connection.cursor() as cursor:
+                if not queryset.query.where and not queryset.query.distinct and not queryset.query.is_sliced:
+                    cursor.execute(
+                        'SELECT TABLE_ROWS FROM information_schema.TABLES '
+                        'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s',
+                        [queryset.model._meta.db_table],
+                    )
+                    row = cursor.fetchone()
+                    result = int(row[0]) if row and row[0] is not None else None
+
+                else:
+                    sql, params = queryset.query.sql_with_params()
+                    cursor.execute(f'EXPLAIN {sql}', params)
+                    columns = [column[0].lower() for column in cursor.description]
+
+                    # 조인된 테이블 별 (검사 행 수 * 조건 통과 비율) 의 곱
+                    estimate = 1.0
+                    for row in cursor.fetchall():
+                        explain = dict(zip(columns, row))
+                        estimate *= float(explain.get('rows') or 0) * float(explain.get('filtered') or 100) / 100
+                    result = int(estimate)
+
+        except Exception as e:
+            logger.warning(f'[EstimatedCount - estimate] {to_str(e)}')
+
+        finally:
+            return result
+
+
+COUNT_STRATEGIES = {
+    'exact': ExactCount,
+    'cached': CachedCount,
+    'estimated': EstimatedCount,
+}
+
+
+# 설정(PAGINATION_COUNT_STRATEGY)의 기본 건수 계산 방식
+def get_default_count_strategy():
+    return COUNT_STRATEGIES[settings.PAGINATION_COUNT_STRATEGY]()
+
+
+class CountStrategyPage(Page):
+    """
+    정확하지 않은 건수로 만든 페이지 : 다음 페이지 존재 여부를 전체 건수 대신 1건 더 조회한 결과로 판단
+    """
+
+    def __init__(self, object_list, number, paginator, has_more):
+        super().__init__(object_list, number, paginator)
+        self.has_more = has_more
+
+    def has_next(self):
+        return self.has_more
+
+
+class CountStrategyPaginator(Paginator):
+    """
+    전체 건수를 건수 계산 방식(count_func)으로 계산하는 Paginator
+    추정 또는 캐시된 건수인 경우 실제 건수보다 작을 수 있으므로 페이지 번호를 전체 페이지 수로 제한하지 않음
+    (마지막 페이지 이후의 페이지 번호는 빈 페이지로 조회)
+    """
+
+    def __init__(self, object_list, per_page, count_func=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_func = count_func
+        self.count_exact = True
+
+    @cached_property
+    def count(self):
+        if self.count_func is None:
+            return super().count
+
+        count, self.count_exact = self.count_func(self.object_list)
+        return count
+
+    def validate_number(self, number):
+        # 건수 계산 후 정확한 건수 여부 확인
+        self.count
+        if self.count_exact:
+            return super().validate_number(number)
+
+        try:
+            number = super().validate_number(number)
+        except EmptyPage:
+            # 범위 초과 여부만 무시 (1 미만은 그대로 오류)
+            number = int(number)
+            if number < 1:
+                raise
+
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if self.count_exact:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom:bottom + self.per_page + 1])
+
+        return CountStrategyPage(
+            object_list[:self.per_page], number, self, len(object_list) > self.per_page
+        )
+
+
+class CustomCursorPagination(BasePagination):
+    """
+    커서 기반 페이지네이션 : (정렬 필드, 아이디) 값 이후의 데이터를 인덱스로 바로 찾아 조회하므로
+    OFFSET 없이 페이지 위치와 무관하게 일정한 비용으로 조회
+
+    - 정렬 : 쿼리셋의 첫 번째 정렬 필드 또는 어노테이션(OrderingFilter 또는 모델 기본 정렬) + 아이디
+    - NULL 값은 가장 작은 값으로 취급 (오름차순 시 처음, 내림차순 시 마지막)
+    - 커서 : {"v": 정렬 필드 값, "pk": 아이디, "r": 이전 페이지 여부}를 base64로 인코딩한 값
+    - 전체 건수 : 첫 페이지(cursor 파라미터 없음)에서만 건수 계산 방식(count_strategy)으로 계산, None 인 경우 설정(PAGINATION_COUNT_STRATEGY)의 기본 방식
+      이후 페이지는 건수를 계산하지 않고 count, count_exact 를 null 로 반환
+    """
+
+    page_size = 10
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+
+    count_strategy = None
+
+    # 쿼리셋에 정렬이 없는 경우 사용할 정렬
+    ordering = '-pk'
+
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+
+        if cursor is None:
+            self.count, self.count_exact = (self.count_strategy or get_default_count_strategy()).count(queryset, request)
+        else:
+            self.count, self.count_exact = None, None
+
+        self.field_name, self.descending = self.get_ordering(queryset)
+        if self.field_name == 'pk':
+            self.field = queryset.model._meta.pk
+        elif self.field_name in queryset.query.annotations:
+            # 어노테이션(예 : 검색 관련도)으로 정렬하는 경우
+            self.field = None
+        else:
+            self.field = queryset.model._meta.get_field(self.field_name)
+
+        # 이전 페이지는 역방향으로 조회한 뒤 결과 순서를 되돌림
+        reverse = cursor is not None and cursor['r']
+        descending = self.descending != reverse
+
+        queryset = queryset.order_by(*self.get_order_by(descending))
+        if cursor is not None:
+            value = cursor['v']
+            if value is not None and self.field is not None and self.field_name != 'pk':
+                try:
+                    value = self.field.to_python(value)
+                except ValidationError:
+                    raise NotFound(self.invalid_cursor_message)
+
+            queryset = queryset.filter(self.get_seek_filter(value, cursor['pk'], descending))
+
+        # 다음(이전) 페이지 존재 여부 확인을 위해 1건 더 조회
+        results = list(queryset[:page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = results
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.count,
+            'count_exact': self.count_exact,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer', 'nullable': True},
+                'count_exact': {'type': 'boolean', 'nullable': True},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+            if page_size > 0:
+                return page_size
+
+        except (KeyError, ValueError):
+            pass
+
+        return self.page_size
+
+    # (정렬 필드 명, 내림차순 여부) 반환
+    def get_ordering(self, queryset):
+        ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering) or [self.ordering]
+
+        field_name = ordering[0]
+        if not isinstance(field_name, str) or '__' in field_name.lstrip('-') or field_name.lstrip('-') == '?':
+            field_name = self.ordering
+
+        descending = field_name.startswith('-')
+        field_name = field_name.lstrip('-')
+
+        if field_name in ('id', queryset.model._meta.pk.name):
+            field_name = 'pk'
+
+        return field_name, descending
+
+    def get_order_by(self, descending):
+        if descending:
+            order_by = [F(self.field_name).desc(nulls_last=True)]
+        else:
+            order_by = [F(self.field_name).asc(nulls_first=True)]
+
+        if self.field_name != 'pk':
+            order_by.append('-pk' if descending else 'pk')
+
+        return order_by
+
+    # 커서 위치 이후의 데이터 조회 조건 (NULL은 가장 작은 값으로 취급)
+    def get_seek_filter(self, value, pk, descending):
+        lookup = 'lt' if descending else 'gt'
+
+        if self.field_name == 'pk':
+            return Q(**{f'pk__{lookup}': pk})
+
+        if value is None:
+            seek_filter = Q(**{f'{self.field_name}__isnull': True, f'pk__{lookup}': pk})
+            if not descending:
+                seek_filter |= Q(**{f'{self.field_name}__isnull': False})
+
+            return seek_filter
+
+        seek_filter = Q(**{f'{self.field_name}__{lookup}': value}) | Q(**{self.field_name: value, f'pk__{lookup}': pk})
+        if descending and (self.field is None or self.field.null):
+            seek_filter |= Q(**{f'{self.field_name}__isnull': True})
+
+        return seek_filter
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            return {'v': cursor['v'], 'pk': int(cursor['pk']), 'r': bool(cursor.get('r'))}
+
+        except (TypeError, ValueError, KeyError, UnicodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, obj, reverse):
+        if self.field_name == 'pk':
+            value = None
+        elif self.field is None:
+            value = getattr(obj, self.field_name)
+        else:
+            value = getattr(obj, self.field.attname)
+            if value is not None:
+                value = self.field.value_to_string(obj)
+
+        cursor = {'v': value, 'pk': obj.pk}
+        if reverse:
+            cursor['r'] = 1
+
+        encoded = base64.urlsafe_b64encode(json.dumps(cursor, separators=(',', ':')).encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+
+        return self.encode_cursor(self.page[-1], False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+
+        return self.encode_cursor(self.page[0], True)
 
 
 class CustomPagination(PageNumberPagination):
+    """
+    페이지 번호 기반 페이지네이션
+    cursor 파라미터가 있는 경우 (빈 값은 첫 페이지) CustomCursorPagination으로 처리
+    전체 건수는 건수 계산 방식(count_strategy)으로 계산하며, 추정 또는 캐시된 건수인 경우 count_exact 가 False
+    """
+
     page_size = 10
     page_size_query_param = 'page_size'
 
+    count_strategy = None
+
+    cursor_pagination = None
+
+    @property
+    def django_paginator_class(self):
+        count_strategy = self.count_strategy or get_default_count_strategy()
+        return functools.partial(
+            CountStrategyPaginator,
+            count_func=lambda queryset: count_strategy.count(queryset, self.request),
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if CustomCursorPagination.cursor_query_param in request.query_params:
+            self.cursor_pagination = CustomCursorPagination()
+            self.cursor_pagination.count_strategy = self.count_strategy
+            return self.cursor_pagination.paginate_queryset(queryset, request, view)
+
+        return super().paginate_queryset(queryset, request, view)
+
     def get_paginated_response(self, data):
+        if self.cursor_pagination is not None:
+            return self.cursor_pagination.get_paginated_response(data)
+
         return Response({
             'count': self.page.paginator.count,
+            'count_exact': self.page.paginator.count_exact,
             'current_page': self.page.number,
             'next': self.get_next_link(),
             'previous': self.get_previous_link(),
             'total_pages': self.page.paginator.num_pages,
             'results': data,
-        })
\ No newline at end of file
+        })
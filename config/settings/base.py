@@ -39,6 +39,12 @@ ALLOWED_HOSTS = env.list("ALLOWED_HOSTS", default=["localhost", "127.0.0.1"])
 
 AES_KEY = env("AES_KEY")
 AES_KEY_IV = env("AES_KEY_IV")
+# 현재 암호화 키 버전 (키 교체 시 증가, 버전 1은 접두어 없는 기존 암호문)
+AES_KEY_VERSION = env.int("AES_KEY_VERSION", default=1)
+# 키 교체 중 복호화에 사용할 이전 키 목록 ("버전:키:IV" 형식, 콤마로 구분)
+AES_PREVIOUS_KEYS = env.list("AES_PREVIOUS_KEYS", default=[])
+# 암호화 필드 검색용 블라인드 인덱스 및 검색 토큰 키 (필수, SECRET_KEY / AES 키와 별도 값으로 교체와 무관하게 유지되어야 함)
+BLIND_INDEX_KEY = env("BLIND_INDEX_KEY")
 
 
 # Application definition
@@ -55,6 +61,7 @@ INSTALLED_APPS = [
     'corsheaders',
     'django_filters',
     'drf_yasg',
+    'django_crontab',
     'api',
 ]
 
@@ -67,6 +74,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'config.audit_context.AuditContextMiddleware',
     'config.custom_exception_handler.ExceptionMiddleware',
 ]
 
@@ -115,6 +123,16 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# 기본값은 프로세스 별 로컬 메모리 캐시 (gunicorn 등 다중 워커 환경에서 캐시 삭제가 다른 워커에 반영되지 않음)
+# 워커 간 캐시 공유가 필요하면 CACHE_URL 지정 (예: rediscache://127.0.0.1:6379/1, redis 패키지 필요)
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -205,6 +223,20 @@ SIMPLE_JWT = {
     'SLIDING_TOKEN_REFRESH_SERIALIZER': 'rest_framework_simplejwt.serializers.TokenRefreshSlidingSerializer',
 }
 
+# 로또 번호 별 당첨 횟수 통계 (동행복권 통계 페이지 조회 결과를 캐시, 갱신 주기가 지나면 백그라운드에서 갱신)
+LOTTO_STATS_TTL = env.int('LOTTO_STATS_TTL', default=60 * 60 * 24)   # 갱신 주기(초)
+LOTTO_STATS_CONNECT_TIMEOUT = env.float('LOTTO_STATS_CONNECT_TIMEOUT', default=3.0)   # 연결 제한 시간(초)
+LOTTO_STATS_READ_TIMEOUT = env.float('LOTTO_STATS_READ_TIMEOUT', default=10.0)   # 응답 제한 시간(초)
+LOTTO_STATS_OFFLINE = env.bool('LOTTO_STATS_OFFLINE', default=False)   # True 인 경우 원격 조회 없이 통계 파일만 사용
+LOTTO_STATS_FILE = env('LOTTO_STATS_FILE', default=str(BASE_DIR / 'api' / 'data_lotto_stats.json'))   # 오프라인 및 원격 조회 실패 시 사용할 통계 파일
+
+# 권한 그룹 목록 캐시 유지 시간(초) : 그룹 변경 시 캐시를 삭제하지만 로컬 메모리 캐시(CACHE_URL 미지정)에서는 다른 워커에 최대 이 시간만큼 이전 그룹 목록이 남음
+# (사용자 추가/수정 시 권한 그룹은 캐시 대신 DB에서 조회하므로 필터 선택 항목에만 영향)
+GROUP_CACHE_TIMEOUT = env.int('GROUP_CACHE_TIMEOUT', default=60)
+
+# 관리자 전용 변경 요청(POST/PUT/DELETE)은 토큰의 groups 클레임 대신 DB로 권한 확인 (권한 회수 즉시 반영이 필요한 경우 사용)
+PERMISSION_ADMIN_DB_CHECK = env.bool('PERMISSION_ADMIN_DB_CHECK', default=False)
+
 SWAGGER_SETTINGS = {
     # Django Login 버튼 삭제 처리
     'USE_SESSION_AUTH': False,
@@ -218,7 +250,19 @@ SWAGGER_SETTINGS = {
     }
 }
 
+# 페이지네이션 전체 건수 계산 방식 (exact : 매번 COUNT(*), cached : 사용자/필터 별 캐시, estimated : 기준 이상은 MySQL 추정치)
+# estimated 는 목록 요청마다 추정 조회(EXPLAIN 등) 1회가 추가되므로 대용량 목록 뷰에서 count_strategy 로 지정하여 사용
+PAGINATION_COUNT_STRATEGY = env('PAGINATION_COUNT_STRATEGY', default='exact')
+PAGINATION_COUNT_CACHE_TIMEOUT = env.int('PAGINATION_COUNT_CACHE_TIMEOUT', default=60)   # cached 방식의 캐시 유지 시간(초)
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = env.int('PAGINATION_COUNT_ESTIMATE_THRESHOLD', default=100000)   # 추정 건수가 이 값 이상이면 추정치 사용
+
 LOGDIR = Path(os.getenv('LOGDIR')) if os.getenv('LOGDIR') else BASE_DIR / 'logs'
+
+# 감사 로그 버퍼링 설정 (ASYNC=False 인 경우 요청 처리 중 즉시 저장)
+AUDIT_LOG_ASYNC = env.bool('AUDIT_LOG_ASYNC', default=True)
+AUDIT_LOG_BATCH_SIZE = env.int('AUDIT_LOG_BATCH_SIZE', default=100)   # 버퍼 건수가 이 값 이상이면 즉시 저장
+AUDIT_LOG_FLUSH_INTERVAL = env.float('AUDIT_LOG_FLUSH_INTERVAL', default=1.0)   # 저장 주기(초)
+AUDIT_LOG_SPOOL_DIR = LOGDIR   # 저장 전 감사 로그를 기록하는 스풀 파일 경로 (비정상 종료 시 복구용)
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -286,6 +330,20 @@ STATIC_ROOT = '/var/www/html/'
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# 감사 로그 보관 기간(월) 및 파티션 삭제 전 아카이브(gzip NDJSON) 저장 경로
+AUDIT_LOG_RETENTION_MONTHS = env.int('AUDIT_LOG_RETENTION_MONTHS', default=12)
+AUDIT_LOG_ARCHIVE_DIR = MEDIA_ROOT / 'audit_log_archive'
+
+# 주기 실행 작업 (django-crontab, 등록 : python manage.py crontab add)
+CRONJOBS = [
+    # 감사 로그 일 단위 증분 집계 (통계 조회용)
+    ('*/10 * * * *', 'django.core.management.call_command', ['rollup_audit_log']),
+    # 사용자 별 항목 건수 보정 (대시보드 통계)
+    ('0 4 * * *', 'django.core.management.call_command', ['reconcile_user_stats']),
+    # 로또 번호 별 통계 파일 갱신 (매주 토요일 추첨 이후)
+    ('0 23 * * 6', 'django.core.management.call_command', ['update_lotto_stats']),
+]
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.1/ref/settings/#default-auto-field
 
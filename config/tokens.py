@@ -1,11 +1,12 @@
+from django.contrib.auth.models import Group
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer, \
     TokenVerifySerializer
-from rest_framework_simplejwt.tokens import UntypedToken
+from rest_framework_simplejwt.tokens import AccessToken, UntypedToken
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView, TokenVerifyView
 
 from utils.format_helper import *
-from utils.log_helper import insert_audit_log
+from utils.log_helper import insert_audit_log, get_audit_context
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -25,7 +26,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
             return data
         finally:
-            insert_audit_log(user, self.context.get('request'), "계정", "로그인", action, result)
+            insert_audit_log(get_audit_context(self.context.get('request')), "계정", "로그인", action, result, user=user)
 
     def get_token(cls, user):
         token = super().get_token(user)
@@ -44,6 +45,13 @@ class CustomTokenRefreshSerializer(TokenRefreshSerializer):
     def validate(self, attrs):
         data = super().validate(attrs)
 
+        # 권한 확인 시 groups 클레임을 사용하므로 재발급 시점의 그룹으로 갱신 (권한 변경 반영 지연을 액세스 토큰 유효 시간으로 제한)
+        access = AccessToken(data['access'])
+        access['groups'] = list(
+            Group.objects.filter(user__username=access.get('username')).values_list('name', flat=True)
+        )
+        data['access'] = str(access)
+
         refresh = self.token_class(attrs["refresh"])
         data['access_exp'] = int((datetime.now() + refresh.access_token.lifetime).timestamp())
 
@@ -1,5 +1,10 @@
 import base64
+import codecs
+import hashlib
+import hmac
+import itertools
 import logging
+import zlib
 
 from Crypto.Cipher import AES
 from django.conf import settings
@@ -16,18 +21,48 @@ pad = (
 )
 unpad = lambda s: s[: -ord(s[len(s) - 1 :])]
 
+# 블라인드 인덱스 길이 (HMAC-SHA256 hex digest 앞 32자리 = 128bit)
+BLIND_INDEX_LENGTH = 32
+
+# 암호문 봉투 형식 : "$" + base64(봉투 버전 1byte + 플래그 1byte + AES 암호문)
+# 압축 효과가 있는 긴 값에만 적용하고, 짧은 값은 동일 평문 = 동일 암호문이 유지되도록 기존 형식으로 저장
+ENVELOPE_MARKER = "$"
+ENVELOPE_VERSION = 1
+ENVELOPE_FLAG_ZLIB = 0x01
+COMPRESS_MIN_SIZE = 512
+COMPRESS_LEVEL = 1
+
+# 스트리밍 복호화 청크 크기 (base64 문자 수, 디코딩 결과가 AES 블록 크기의 배수가 되도록 64의 배수)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 키 버전 접두어 (v2:xxxx), 버전 1(최초 키)은 기존 암호문과의 호환을 위해 접두어 없이 저장
+LEGACY_KEY_VERSION = 1
+KEY_VERSION_PREFIX = "v"
+KEY_VERSION_SEPARATOR = ":"
+
+# 프로세스 단위로 재사용하는 키 버전 별 AESCipher 객체 (get_cipher()를 통해 최초 1회 생성)
+_ciphers = None
+_current_key_version = None
+_blind_index_key = None
+
 
 class AESCipher(object):
     def __init__(self, key, iv):
         self.key = bytes.fromhex(key)
         self.iv = bytes.fromhex(iv)
 
+    def encrypt_bytes(self, raw):
+        cipher = AES.new(self.key, AES.MODE_CBC, self.iv)
+        return cipher.encrypt(pad(raw))
+
+    def decrypt_bytes(self, enc):
+        cipher = AES.new(self.key, AES.MODE_CBC, self.iv)
+        return unpad(cipher.decrypt(enc))
+
     def encrypt(self, message):
         try:
             message = message.encode()
-            raw = pad(message)
-            cipher = AES.new(self.key, AES.MODE_CBC, self.iv)
-            enc = cipher.encrypt(raw)
+            enc = self.encrypt_bytes(message)
             return base64.b64encode(enc).decode("utf-8")
 
         except Exception as e:
@@ -36,27 +71,195 @@ class AESCipher(object):
     def decrypt(self, enc):
         try:
             enc = base64.b64decode(enc)
-            cipher = AES.new(self.key, AES.MODE_CBC, self.iv)
-            dec = cipher.decrypt(enc)
-            return unpad(dec).decode("utf-8")
+            return self.decrypt_bytes(enc).decode("utf-8")
 
         except Exception as e:
             logger.warning(f"[decrypt] {to_str(e)}")
 
+    # 청크 단위 복호화 (패딩 제거를 위해 마지막 BLOCK_SIZE 만큼은 보류 후 반환)
+    def iter_decrypt_bytes(self, enc_chunks):
+        cipher = AES.new(self.key, AES.MODE_CBC, self.iv)
+        buffer = b""
+        pending = b""
+
+        for chunk in enc_chunks:
+            buffer += chunk
+            size = len(buffer) - len(buffer) % AES.block_size
+            if not size:
+                continue
+
+            data = pending + cipher.decrypt(buffer[:size])
+            buffer = buffer[size:]
+
+            pending = data[-BLOCK_SIZE:]
+            if len(data) > BLOCK_SIZE:
+                yield data[:-BLOCK_SIZE]
+
+        if buffer:
+            raise ValueError("암호문 길이가 블록 크기의 배수가 아닙니다.")
+
+        yield unpad(pending)
+
+    # 압축 효과가 있는 경우 봉투 형식으로, 그 외에는 기존 형식으로 암호화
+    def seal(self, message):
+        try:
+            raw = message.encode()
+            if len(raw) >= COMPRESS_MIN_SIZE:
+                compressed = zlib.compress(raw, COMPRESS_LEVEL)
+                if len(compressed) < len(raw):
+                    header = bytes([ENVELOPE_VERSION, ENVELOPE_FLAG_ZLIB])
+                    enc = self.encrypt_bytes(compressed)
+                    return ENVELOPE_MARKER + base64.b64encode(header + enc).decode("utf-8")
+
+            return self.encrypt(message)
+
+        except Exception as e:
+            logger.warning(f"[seal] {to_str(e)}")
+
+    # 봉투 형식 및 기존 형식 암호문 복호화
+    def unseal(self, enc):
+        if not enc.startswith(ENVELOPE_MARKER):
+            return self.decrypt(enc)
+
+        try:
+            data = base64.b64decode(enc[len(ENVELOPE_MARKER) :])
+            version, flags = data[0], data[1]
+            if version != ENVELOPE_VERSION:
+                raise ValueError(f"지원하지 않는 봉투 버전 : {version}")
+
+            raw = self.decrypt_bytes(data[2:])
+            if flags & ENVELOPE_FLAG_ZLIB:
+                raw = zlib.decompress(raw)
+
+            return raw.decode("utf-8")
+
+        except Exception as e:
+            logger.warning(f"[unseal] {to_str(e)}")
+
+    # 봉투 형식 및 기존 형식 암호문을 청크 단위 문자열로 복호화
+    def iter_unseal(self, enc, chunk_size=STREAM_CHUNK_SIZE):
+        if not enc.startswith(ENVELOPE_MARKER):
+            raw_chunks = self.iter_decrypt_bytes(iter_b64decode(enc, 0, chunk_size))
+
+        else:
+            enc_chunks = iter_b64decode(enc, len(ENVELOPE_MARKER), chunk_size)
+            first = next(enc_chunks)
+            version, flags = first[0], first[1]
+            if version != ENVELOPE_VERSION:
+                raise ValueError(f"지원하지 않는 봉투 버전 : {version}")
+
+            raw_chunks = self.iter_decrypt_bytes(itertools.chain([first[2:]], enc_chunks))
+            if flags & ENVELOPE_FLAG_ZLIB:
+                raw_chunks = iter_decompress(raw_chunks, chunk_size)
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for raw in raw_chunks:
+            text = decoder.decode(raw)
+            if text:
+                yield text
+
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+
+def iter_b64decode(text, start, chunk_size):
+    for i in range(start, len(text), chunk_size):
+        yield base64.b64decode(text[i : i + chunk_size])
+
+
+# 압축 해제 결과가 청크 크기를 넘지 않도록 나누어 반환
+def iter_decompress(chunks, max_length):
+    decompressor = zlib.decompressobj()
+
+    for chunk in chunks:
+        data = chunk
+        while data:
+            raw = decompressor.decompress(data, max_length)
+            if raw:
+                yield raw
+            data = decompressor.unconsumed_tail
+
+    tail = decompressor.flush()
+    if tail:
+        yield tail
+
+
+# 설정 값으로 키 버전 별 AESCipher 객체 생성
+# 현재 키 : AES_KEY, AES_KEY_IV, AES_KEY_VERSION / 이전 키 : AES_PREVIOUS_KEYS ("버전:키:IV" 목록)
+def load_ciphers():
+    global _ciphers, _current_key_version
+
+    ciphers = {}
+    for previous_key in getattr(settings, "AES_PREVIOUS_KEYS", []):
+        version, key, iv = previous_key.split(":")
+        ciphers[int(version)] = AESCipher(key, iv)
+
+    current_key_version = int(getattr(settings, "AES_KEY_VERSION", LEGACY_KEY_VERSION))
+    ciphers[current_key_version] = AESCipher(
+        getattr(settings, "AES_KEY"), getattr(settings, "AES_KEY_IV")
+    )
+
+    _ciphers = ciphers
+    _current_key_version = current_key_version
+
+
+def get_current_key_version():
+    if _ciphers is None:
+        load_ciphers()
+
+    return _current_key_version
+
+
+# 키 버전에 해당하는 AESCipher 객체 조회 (버전 미지정 시 현재 키)
+def get_cipher(version=None):
+    if _ciphers is None:
+        load_ciphers()
+
+    return _ciphers.get(_current_key_version if version is None else version)
+
+
+# 암호문을 (키 버전, 암호문 본문)으로 분리
+def split_key_version(enc_value):
+    if KEY_VERSION_SEPARATOR not in enc_value:
+        return LEGACY_KEY_VERSION, enc_value
+
+    version, body = enc_value.split(KEY_VERSION_SEPARATOR, 1)
+    return int(version[len(KEY_VERSION_PREFIX) :]), body
+
+
+def get_key_version(enc_value):
+    return split_key_version(enc_value)[0]
+
+
+def encrypt_with_version(aes, version, value):
+    enc_value = aes.seal(value)
+    if enc_value is None or version == LEGACY_KEY_VERSION:
+        return enc_value
+
+    return f"{KEY_VERSION_PREFIX}{version}{KEY_VERSION_SEPARATOR}{enc_value}"
+
+
+def decrypt_with_version(enc_value):
+    version, body = split_key_version(enc_value)
+
+    aes = get_cipher(version)
+    if aes is None:
+        logger.warning(f"[decrypt_with_version] 등록되지 않은 키 버전 : {version}")
+        return None
+
+    return aes.unseal(body)
+
 
 # 키 값 암호화 수행
 def make_enc_value(value):
     result = value
 
     try:
-        key = getattr(settings, "AES_KEY")
-        iv = getattr(settings, "AES_KEY_IV")
-        aes = AESCipher(key, iv)
-
-        result = aes.encrypt(value)
+        result = encrypt_with_version(get_cipher(), get_current_key_version(), value)
 
     except Exception as e:
-        logger.warning(f"[NoteAPI - make_enc_value] {to_str(e)}")
+        logger.warning(f"[make_enc_value] {to_str(e)}")
 
     finally:
         return result
@@ -67,14 +270,97 @@ def get_dec_value(enc_value):
     result = enc_value
 
     try:
-        key = getattr(settings, "AES_KEY")
-        iv = getattr(settings, "AES_KEY_IV")
-        aes = AESCipher(key, iv)
-
-        result = aes.decrypt(enc_value)
+        result = decrypt_with_version(enc_value)
 
     except Exception as e:
-        logger.warning(f"[NoteAPI - get_dec_value] {to_str(e)}")
+        logger.warning(f"[get_dec_value] {to_str(e)}")
 
     finally:
         return result
+
+
+# 키 값 목록 일괄 암호화 수행 (빈 값은 그대로 반환, 암호화 실패 항목은 None 반환)
+def encrypt_many(values):
+    result = []
+
+    aes = get_cipher()
+    version = get_current_key_version()
+    for value in values:
+        enc_value = value
+
+        if value:
+            try:
+                enc_value = encrypt_with_version(aes, version, value)
+
+            except Exception as e:
+                logger.warning(f"[encrypt_many] {to_str(e)}")
+                enc_value = None
+
+        result.append(enc_value)
+
+    return result
+
+
+# 키 값 목록 일괄 복호화 수행 (빈 값은 그대로 반환, 복호화 실패 항목은 None 반환)
+def decrypt_many(enc_values):
+    result = []
+
+    for enc_value in enc_values:
+        dec_value = enc_value
+
+        if enc_value:
+            try:
+                dec_value = decrypt_with_version(enc_value)
+
+            except Exception as e:
+                logger.warning(f"[decrypt_many] {to_str(e)}")
+                dec_value = None
+
+        result.append(dec_value)
+
+    return result
+
+
+# 평문 동등 비교 검색을 위한 블라인드 인덱스(HMAC) 생성 (빈 값은 None 반환)
+def make_blind_index(value):
+    global _blind_index_key
+
+    if not value:
+        return None
+
+    if _blind_index_key is None:
+        _blind_index_key = getattr(settings, "BLIND_INDEX_KEY").encode()
+
+    digest = hmac.new(_blind_index_key, value.encode(), hashlib.sha256).hexdigest()
+    return digest[:BLIND_INDEX_LENGTH]
+
+
+# 키 값 스트리밍 복호화 수행 (청크 단위 문자열 반환, 전체 평문을 메모리에 올리지 않음)
+def iter_dec_value(enc_value, chunk_size=STREAM_CHUNK_SIZE):
+    if not enc_value:
+        return
+
+    version, body = split_key_version(enc_value)
+
+    aes = get_cipher(version)
+    if aes is None:
+        raise ValueError(f"등록되지 않은 키 버전 : {version}")
+
+    try:
+        yield from aes.iter_unseal(body, chunk_size)
+
+    except Exception as e:
+        logger.warning(f"[iter_dec_value] {to_str(e)}")
+        raise
+
+
+# 스트리밍 응답용 복호화 : 키 버전 확인 및 첫 청크 복호화를 먼저 수행하여 응답 시작 전에 오류 발생
+# (반환된 이터레이터에서는 첫 청크 이후의 복호화 수행)
+def open_dec_stream(enc_value, chunk_size=STREAM_CHUNK_SIZE):
+    chunks = iter_dec_value(enc_value, chunk_size)
+
+    first = next(chunks, None)
+    if first is None:
+        return iter(())
+
+    return itertools.chain([first], chunks)
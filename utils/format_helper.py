@@ -1,5 +1,6 @@
 import ipaddress
 import logging
+import socket
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
@@ -98,6 +99,43 @@ def ip_to_int(input_ip):
         return ip_addr
 
 
+# IPv4-mapped IPv6 주소 앞 12바이트 (::ffff:0:0/96)
+IPV4_MAPPED_PREFIX = b"\x00" * 10 + b"\xff\xff"
+
+
+# IP 주소(IPv4/IPv6 문자열 또는 정수)를 16바이트로 변환 (IPv4는 IPv4-mapped IPv6 형식, 변환 실패 시 None)
+def ip_to_bytes(input_ip):
+    result = None
+
+    try:
+        ip_addr = ipaddress.ip_address(input_ip.strip() if isinstance(input_ip, str) else input_ip)
+        result = IPV4_MAPPED_PREFIX + ip_addr.packed if ip_addr.version == 4 else ip_addr.packed
+
+    except Exception as e:
+        logger.warning(f"[ip_to_bytes] {to_str(e)}")
+
+    finally:
+        return result
+
+
+# 16바이트 IP 주소를 문자열로 변환 (행 단위 변환에 사용하므로 ipaddress 객체 대신 inet_ntop 사용)
+def bytes_to_ip(input_bytes):
+    result = None
+
+    try:
+        input_bytes = bytes(input_bytes)
+        if input_bytes[:12] == IPV4_MAPPED_PREFIX:
+            result = socket.inet_ntop(socket.AF_INET, input_bytes[12:])
+        else:
+            result = socket.inet_ntop(socket.AF_INET6, input_bytes)
+
+    except Exception as e:
+        logger.warning(f"[bytes_to_ip] {to_str(e)}")
+
+    finally:
+        return result
+
+
 def list_to_str(param):
     result = param
 
@@ -0,0 +1,36 @@
+import logging
+
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+GROUP_CACHE_KEY = "auth_group_map"
+
+
+# 그룹 명 → 그룹 객체 (그룹은 거의 변경되지 않으므로 캐시, 그룹 변경 시 삭제)
+def get_group_map(refresh=False):
+    group_map = None if refresh else cache.get(GROUP_CACHE_KEY)
+    if group_map is None:
+        group_map = {group.name: group for group in Group.objects.all()}
+        cache.set(GROUP_CACHE_KEY, group_map, settings.GROUP_CACHE_TIMEOUT)
+
+    return group_map
+
+
+# 그룹 명 목록에 해당하는 그룹 객체 목록 (존재하지 않는 그룹 명은 제외)
+# 사용자 권한 변경에 사용하므로 다른 워커에서 삭제/변경된 그룹이 남아 있을 수 있는 캐시 대신 DB에서 조회
+def get_groups(names):
+    group_map = {group.name: group for group in Group.objects.filter(name__in=names)}
+
+    return [group_map[name] for name in names if name in group_map]
+
+
+# 그룹 선택 목록 : [(그룹 명, 그룹 명)] (필터 선택 항목 등에서 호출 시점에 조회)
+def get_group_choices():
+    return [(name, name) for name in get_group_map()]
+
+
+def clear_group_cache(**kwargs):
+    cache.delete(GROUP_CACHE_KEY)
@@ -1,32 +1,279 @@
+import atexit
+import glob
+import json
 import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from django.conf import settings
+from django.db import DataError, IntegrityError, close_old_connections, transaction
 
 from api import models
-from utils.format_helper import ip_to_int, to_str
-from utils.network_helper import get_client_ip
+from utils.format_helper import to_str, to_int, ip_to_bytes
+from utils.network_helper import get_client_ip_addr
+from utils.search_helper import index_audit_logs
 
 logger = logging.getLogger(__name__)
 
+SPOOL_DATE_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+# 프로세스 단위 감사 로그 버퍼 (gunicorn --preload 환경에서 fork 이후 워커 별로 생성)
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+class AuditContext(object):
+    """
+    요청 단위 감사 로그 정보 (클라이언트 IP 주소, 요청 아이디)
+    사용자는 인증(JWT) 이후 결정되므로 조회 시점에 요청 객체에서 확인
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.ip = get_client_ip_addr(request)
+        self.request_id = request.META.get("HTTP_X_REQUEST_ID") or uuid.uuid4().hex
+
+    @property
+    def user(self):
+        user = getattr(self.request, "user", None)
+        if user is None or not user.is_authenticated:
+            return None
+
+        return user.username
+
+
+# 요청에 연결된 감사 로그 정보 조회 (AuditContextMiddleware를 거치지 않은 경우 생성 후 연결)
+def get_audit_context(request):
+    context = getattr(request, "audit_context", None)
+    if context is None:
+        context = AuditContext(getattr(request, "_request", request))
+        request.audit_context = context
+
+    return context
+
+
+class AuditLogBuffer(object):
+    """
+    감사 로그를 메모리에 모아 백그라운드 스레드에서 bulk_create로 일괄 저장
+    버퍼에 추가하기 전 프로세스 별 스풀 파일에 먼저 기록하고, 저장이 끝난 스풀 파일만 삭제하므로
+    프로세스 비정상 종료나 DB 장애 시에도 다음 저장 주기에 스풀 파일에서 복구
+
+    스풀 파일 : audit_log.<pid>.spool (기록 중), audit_log.<pid>.<순번>.pending (저장 대기)
+    복구할 수 없는 스풀 파일(형식 오류, 저장 불가 데이터)은 <파일명>.failed 로 이름을 변경하여 보관
+    """
+
+    def __init__(self, spool_dir, batch_size, flush_interval):
+        self.pid = os.getpid()
+        self.spool_dir = spool_dir
+        self.spool_path = os.path.join(spool_dir, f"audit_log.{self.pid}.spool")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.entries = []
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.wakeup = threading.Event()
+
+        # 동일 PID로 남아있는 이전 프로세스의 스풀 파일은 저장 대기 파일로 전환하여 복구
+        if os.path.exists(self.spool_path):
+            os.replace(self.spool_path, self.get_pending_path())
+        self.spool = open(self.spool_path, "a", encoding="utf-8")
+
+        self.thread = threading.Thread(target=self.run, name="audit-log-buffer", daemon=True)
+        self.thread.start()
+        atexit.register(self.flush)
+
+    def get_pending_path(self):
+        return os.path.join(self.spool_dir, f"audit_log.{self.pid}.{time.time_ns()}.pending")
+
+    def append(self, entry):
+        with self.lock:
+            self.spool.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self.spool.flush()
+            self.entries.append(entry)
+            size = len(self.entries)
+
+        if size >= self.batch_size:
+            self.wakeup.set()
+
+    def run(self):
+        while True:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+
+            # 저장 실패 시에도 이전 저장 대기 파일 복구는 수행
+            for task in (self.flush, self.recover):
+                try:
+                    close_old_connections()
+                    task()
+
+                except Exception as e:
+                    logger.warning(f"[AuditLogBuffer - run] {to_str(e)}")
+
+    def flush(self):
+        with self.flush_lock:
+            with self.lock:
+                if not self.entries:
+                    return
+
+                entries = self.entries
+                self.entries = []
+
+                self.spool.close()
+                pending_path = self.get_pending_path()
+                os.replace(self.spool_path, pending_path)
+                self.spool = open(self.spool_path, "a", encoding="utf-8")
+
+            # 저장 실패 시 저장 대기 파일을 남겨두고 recover()에서 재시도
+            save_entries(entries)
+            os.remove(pending_path)
+
+    # 저장되지 않은 스풀 파일 복구 (자신의 저장 대기 파일 및 종료된 프로세스의 스풀 파일)
+    # 파일 단위로 처리하여 한 파일의 실패가 다른 파일의 복구를 막지 않도록 함
+    def recover(self):
+        with self.flush_lock:
+            for path in glob.glob(os.path.join(self.spool_dir, "audit_log.*")):
+                if path == self.spool_path or not path.endswith((".spool", ".pending")):
+                    continue
 
-def insert_audit_log(user, request, category, sub_category, action, result):
+                try:
+                    owner_pid = int(os.path.basename(path).split(".")[1])
+                    if owner_pid != self.pid:
+                        if is_process_alive(owner_pid):
+                            continue
+
+                        # 여러 워커가 동시에 복구하지 않도록 파일 이름 변경으로 선점
+                        claim_path = self.get_pending_path()
+                        try:
+                            os.replace(path, claim_path)
+                        except FileNotFoundError:
+                            continue
+                        path = claim_path
+
+                    entries = read_spool_file(path)
+                    save_entries(entries)
+                    os.remove(path)
+                    logger.info(f"[AuditLogBuffer - recover] {len(entries)}건 복구")
+
+                except (ValueError, KeyError, TypeError, DataError, IntegrityError) as e:
+                    # 다시 시도해도 저장할 수 없는 파일은 이름을 변경하여 보관 (수동 확인)
+                    logger.warning(f"[AuditLogBuffer - recover] 복구 불가 스풀 파일 보관 ({path}) : {to_str(e)}")
+                    try:
+                        os.replace(path, f"{path}.failed")
+                    except OSError as move_error:
+                        logger.warning(f"[AuditLogBuffer - recover] {to_str(move_error)}")
+
+                except Exception as e:
+                    # DB 연결 오류 등 일시적인 오류는 파일을 남겨두고 다음 주기에 재시도
+                    logger.warning(f"[AuditLogBuffer - recover] {path} : {to_str(e)}")
+
+
+# 스풀 파일 조회 (기록 중 종료되어 줄바꿈 없이 잘린 마지막 줄은 제외, 그 외 형식 오류는 ValueError)
+def read_spool_file(path):
+    entries = []
+
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+
+    for i, line in enumerate(lines):
+        if not line.strip():
+            continue
+
+        try:
+            entries.append(json.loads(line))
+
+        except ValueError:
+            if i == len(lines) - 1 and not line.endswith("\n"):
+                logger.warning(f"[read_spool_file] 잘린 마지막 줄 제외 ({path})")
+                continue
+            raise
+
+    return entries
+
+
+def is_process_alive(pid):
     try:
-        log_result = False
-        ip_int = (
-            ip_to_int(get_client_ip(request))
-            if type(ip_to_int(get_client_ip(request))) is int
-            else None
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+
+    return True
+
+
+# 감사 로그와 전문 검색 색인을 함께 저장 (실패 시 스풀 파일에서 재시도하므로 함께 롤백)
+def save_entries(entries):
+    with transaction.atomic():
+        logs = models.AuditLog.objects.bulk_create(
+            [
+                models.AuditLog(
+                    **{
+                        **entry,
+                        # 스풀 파일에는 문자열로 기록되므로 저장 시 16바이트로 변환
+                        "ip": ip_to_bytes(entry["ip"]) if entry["ip"] is not None else None,
+                        "date": datetime.strptime(entry["date"], SPOOL_DATE_FORMAT),
+                    }
+                )
+                for entry in entries
+            ],
+            batch_size=500,
         )
+        index_audit_logs(logs)
+
+
+def get_audit_log_buffer():
+    global _buffer
+
+    if _buffer is None or _buffer.pid != os.getpid():
+        with _buffer_lock:
+            if _buffer is None or _buffer.pid != os.getpid():
+                _buffer = AuditLogBuffer(
+                    getattr(settings, "AUDIT_LOG_SPOOL_DIR"),
+                    getattr(settings, "AUDIT_LOG_BATCH_SIZE"),
+                    getattr(settings, "AUDIT_LOG_FLUSH_INTERVAL"),
+                )
+
+    return _buffer
 
-        audit_log_data = models.AuditLog(
-            user=user,
-            ip=ip_int,
-            category=category,
-            sub_category=sub_category,
-            action=action,
-            result=models.ChoiceResult.SUCCESS
+
+def insert_audit_log(
+    context,
+    category,
+    sub_category,
+    action,
+    result,
+    user=None,
+    object_type=None,
+    object_id=None,
+    changes=None,
+):
+    try:
+        log_result = False
+
+        entry = {
+            "user": user if user is not None else context.user,
+            "ip": context.ip,
+            "category": category,
+            "sub_category": sub_category,
+            "action": action,
+            "result": models.ChoiceResult.SUCCESS
             if result is True
             else models.ChoiceResult.FAIL,
-        )
-        audit_log_data.save()
+            "object_type": object_type,
+            # URL 경로의 아이디가 숫자가 아닌 경우 (조회 실패) 대상 아이디는 기록하지 않음
+            "object_id": to_int(object_id) if str(object_id).isdigit() else None,
+            "changes": changes or None,
+            "date": datetime.now().strftime(SPOOL_DATE_FORMAT),
+        }
+
+        if getattr(settings, "AUDIT_LOG_ASYNC", False):
+            get_audit_log_buffer().append(entry)
+        else:
+            save_entries([entry])
         log_result = True
 
     except Exception as e:
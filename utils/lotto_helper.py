@@ -0,0 +1,187 @@
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.format_helper import to_str, datetime_to_str
+
+logger = logging.getLogger(__name__)
+
+LOTTO_STATS_URL = "https://dhlottery.co.kr/gameResult.do?method=statByNumber"
+LOTTO_STATS_CACHE_KEY = "lotto_number_stats"
+LOTTO_STATS_REFRESH_KEY = "lotto_number_stats_refresh"
+
+# 프로세스 단위 HTTP 세션 (연결 재사용, gunicorn --preload 환경에서 fork 이후 워커 별로 생성)
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+_refresh_lock = threading.Lock()
+
+
+def get_session():
+    global _session, _session_pid
+
+    if _session is None or _session_pid != os.getpid():
+        with _session_lock:
+            if _session is None or _session_pid != os.getpid():
+                retry = Retry(total=2, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504), allowed_methods=("GET",))
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+
+                _session = session
+                _session_pid = os.getpid()
+
+    return _session
+
+
+# 번호 별 당첨 횟수 통계 페이지에서 통계 테이블만 파싱 : {번호: 당첨 횟수}
+def parse_lotto_stats(content):
+    soup = BeautifulSoup(
+        content, "html.parser", parse_only=SoupStrainer("table", {"class": "tbl_data tbl_data_col"})
+    )
+    stats_table = soup.find("table")
+    if stats_table is None:
+        raise ValueError("번호 별 통계 테이블을 찾을 수 없습니다.")
+
+    stats = {}
+    for tr in stats_table.find_all("tr"):
+        ball_data = [int(td.get_text()) for td in tr.find_all("td") if "\n\n" not in td.get_text()]
+        if ball_data:
+            stats[ball_data[0]] = ball_data[1]
+
+    if not stats:
+        raise ValueError("번호 별 통계 데이터가 없습니다.")
+
+    return stats
+
+
+def fetch_lotto_stats():
+    response = get_session().get(
+        LOTTO_STATS_URL,
+        timeout=(settings.LOTTO_STATS_CONNECT_TIMEOUT, settings.LOTTO_STATS_READ_TIMEOUT),
+    )
+    response.raise_for_status()
+
+    return parse_lotto_stats(response.content)
+
+
+# 통계 파일 조회 (네트워크 없이 사용) : {"updated_at": 갱신 일시, "stats": {번호: 당첨 횟수}}
+# 파일이 없거나 읽을 수 없는 경우 None 반환 (update_lotto_stats 명령으로 생성)
+def load_lotto_stats_file(path=None):
+    try:
+        result = None
+
+        with open(path or settings.LOTTO_STATS_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+
+        result = {int(number): int(count) for number, count in data["stats"].items()}
+
+    except Exception as e:
+        logger.warning(f"[load_lotto_stats_file] {to_str(e)}")
+
+    finally:
+        return result
+
+
+def save_lotto_stats_file(stats, path=None):
+    path = path or settings.LOTTO_STATS_FILE
+    temp_path = f"{path}.tmp"
+
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "updated_at": datetime_to_str(datetime.now(), "%Y-%m-%d %H:%M:%S"),
+                "stats": {str(number): count for number, count in sorted(stats.items())},
+            },
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+    os.replace(temp_path, path)
+
+
+def set_lotto_stats_cache(stats, updated_at):
+    # 만료 없이 저장하고 갱신 주기(LOTTO_STATS_TTL)는 updated_at으로 판단 (갱신 실패 시 이전 통계 사용)
+    cache.set(LOTTO_STATS_CACHE_KEY, {"stats": stats, "updated_at": updated_at}, None)
+
+
+# 원격 통계를 조회하여 캐시 갱신 (실패 시 기존 캐시 유지)
+def refresh_lotto_stats():
+    try:
+        result = None
+
+        stats = fetch_lotto_stats()
+        set_lotto_stats_cache(stats, time.time())
+        result = stats
+
+    except Exception as e:
+        logger.warning(f"[refresh_lotto_stats] {to_str(e)}")
+
+    finally:
+        return result
+
+
+# 백그라운드 스레드에서 캐시 갱신 (동시에 하나의 갱신만 실행)
+def refresh_lotto_stats_background():
+    if not _refresh_lock.acquire(blocking=False):
+        return
+
+    # 공유 캐시를 사용하는 경우 다른 프로세스와 중복 갱신 방지
+    if not cache.add(LOTTO_STATS_REFRESH_KEY, True, 60):
+        _refresh_lock.release()
+        return
+
+    def run():
+        try:
+            refresh_lotto_stats()
+        finally:
+            cache.delete(LOTTO_STATS_REFRESH_KEY)
+            _refresh_lock.release()
+
+    threading.Thread(target=run, name="lotto-stats-refresh", daemon=True).start()
+
+
+# 번호 별 당첨 횟수 조회 : {번호: 당첨 횟수}
+# 갱신 주기가 지난 경우 이전 통계를 반환하고 백그라운드에서 갱신
+# 캐시가 없는 경우 통계 파일을 바로 반환하고 백그라운드에서 갱신, 통계 파일도 없는 경우에만 요청 처리 중 조회 (프로세스 당 1회)
+# 원격 조회와 통계 파일 모두 실패한 경우 None 반환
+def get_lotto_stats():
+    entry = cache.get(LOTTO_STATS_CACHE_KEY)
+    if entry is not None:
+        if not settings.LOTTO_STATS_OFFLINE and time.time() - entry["updated_at"] > settings.LOTTO_STATS_TTL:
+            refresh_lotto_stats_background()
+
+        return entry["stats"]
+
+    stats = load_lotto_stats_file()
+    if stats is not None:
+        if settings.LOTTO_STATS_OFFLINE:
+            set_lotto_stats_cache(stats, time.time())
+        else:
+            # 통계 파일은 갱신 일시 0으로 캐시하여 원격 조회 성공 시까지 계속 갱신 시도
+            set_lotto_stats_cache(stats, 0)
+            refresh_lotto_stats_background()
+        return stats
+
+    if settings.LOTTO_STATS_OFFLINE:
+        return None
+
+    # 동시 요청은 먼저 시작한 조회(백그라운드 갱신 포함) 완료를 기다린 뒤 캐시 사용
+    with _refresh_lock:
+        entry = cache.get(LOTTO_STATS_CACHE_KEY)
+        if entry is not None:
+            return entry["stats"]
+
+        return refresh_lotto_stats()
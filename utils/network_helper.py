@@ -1,9 +1,10 @@
+import ipaddress
 import logging
 
 import rest_framework
 from django.core.handlers import wsgi, asgi
 
-from utils.format_helper import to_str
+from utils.format_helper import to_str, ip_to_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -23,3 +24,28 @@ def get_client_ip(request):
         result = to_str(request)
 
     return result
+
+
+# 클라이언트 IP 주소 문자열 (형식이 잘못된 경우 None)
+def get_client_ip_addr(request):
+    try:
+        ip_addr = ipaddress.ip_address(to_str(get_client_ip(request)).strip())
+
+    except ValueError:
+        return None
+
+    return str(ip_addr)
+
+
+# IP 주소 또는 CIDR(IPv4/IPv6)의 16바이트 시작, 끝 주소 (형식이 잘못된 경우 None)
+def get_ip_range_bytes(value):
+    try:
+        ip_network = ipaddress.ip_network(value.strip(), False)
+
+    except ValueError:
+        return None
+
+    return (
+        ip_to_bytes(ip_network.network_address),
+        ip_to_bytes(ip_network.broadcast_address),
+    )
@@ -0,0 +1,226 @@
+import hashlib
+import hmac
+import logging
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import BooleanField, Case, Count, F, FloatField, Func, Value, When
+
+from api import message, models
+from utils.aes_helper import decrypt_many
+from utils.format_helper import to_str
+
+logger = logging.getLogger(__name__)
+
+# 토큰화 n-gram 크기 (1글자 검색을 위해 1-gram 포함)
+NGRAM_SIZES = (1, 2)
+
+# 암호화 필드 부분 일치 검색 n-gram 크기 및 단어 최소 길이
+# 1-gram 은 대부분의 항목과 일치하여 후보를 줄이지 못하므로 2-gram 만 사용하고, 2글자 이상 단어가 없는 검색어는 허용하지 않음
+SEARCH_NGRAM_SIZES = (2,)
+SEARCH_MIN_LENGTH = 2
+
+
+# 검색 대상 식별자 (테이블.필드)
+def get_search_target(model, field):
+    return f"{model._meta.db_table}.{field}"
+
+
+def make_ngrams(text, sizes=NGRAM_SIZES):
+    result = set()
+
+    for word in text.lower().split():
+        for size in sizes:
+            for i in range(len(word) - size + 1):
+                result.add(word[i : i + size])
+
+    return result
+
+
+# 사용자, 대상 별로 키가 분리된 n-gram 토큰(HMAC 앞 8바이트 정수) 목록 생성
+def make_search_tokens(user_id, target, text):
+    if not text:
+        return set()
+
+    key = getattr(settings, "BLIND_INDEX_KEY").encode()
+    prefix = f"{user_id}:{target}:".encode()
+
+    result = set()
+    for ngram in make_ngrams(text, SEARCH_NGRAM_SIZES):
+        digest = hmac.new(key, prefix + ngram.encode(), hashlib.sha256).digest()
+        result.add(int.from_bytes(digest[:8], "big", signed=True))
+
+    return result
+
+
+def build_search_tokens(instance, field, text):
+    target = get_search_target(type(instance), field)
+    tokens = make_search_tokens(instance.user_id, target, text)
+
+    return [
+        models.SearchToken(
+            user_id=instance.user_id, target=target, object_id=instance.id, token=token
+        )
+        for token in tokens
+    ]
+
+
+# 레코드의 검색 토큰 재생성 (기존 토큰 삭제 후 일괄 추가)
+def update_search_index(instance, fields=None):
+    search_fields = fields or models.SEARCH_FIELDS[type(instance)]
+    targets = [get_search_target(type(instance), field) for field in search_fields]
+
+    enc_values = [getattr(instance, field) for field in search_fields]
+    dec_values = decrypt_many(enc_values)
+
+    search_tokens = []
+    for field, dec_value in zip(search_fields, dec_values):
+        search_tokens.extend(build_search_tokens(instance, field, dec_value))
+
+    models.SearchToken.objects.filter(target__in=targets, object_id=instance.id).delete()
+    models.SearchToken.objects.bulk_create(search_tokens, batch_size=1000)
+
+
+def delete_search_index(instance):
+    targets = [
+        get_search_target(type(instance), field)
+        for field in models.SEARCH_FIELDS[type(instance)]
+    ]
+    models.SearchToken.objects.filter(target__in=targets, object_id=instance.id).delete()
+
+
+# 부분 일치 검색어 검증 (필터 validators 에 지정, 2글자 이상 단어가 없으면 토큰이 없으므로 400 응답)
+def validate_search_keyword(value):
+    if not any(len(word) >= SEARCH_MIN_LENGTH for word in value.split()):
+        raise ValidationError(message.search_keyword_too_short)
+
+
+# 부분 일치 검색 : 토큰 역색인으로 검색어의 2-gram 을 모두 포함하는 후보를 조회한 뒤 후보만 복호화하여 일치 여부 확인
+# (페이지네이션 전에 확인하므로 건수 및 페이지는 실제 일치 항목 기준, 2글자 이상 단어가 없는 검색어는 빈 결과)
+def search_contains(queryset, user, field, value):
+    target = get_search_target(queryset.model, field)
+    tokens = make_search_tokens(user.id, target, value)
+    if not tokens:
+        return queryset.none()
+
+    try:
+        candidate_ids = (
+            models.SearchToken.objects.filter(user=user, target=target, token__in=tokens)
+            .values("object_id")
+            .annotate(matched=Count("token", distinct=True))
+            .filter(matched=len(tokens))
+            .values("object_id")
+        )
+
+        rows = list(queryset.filter(id__in=candidate_ids).values_list("id", field))
+        dec_values = decrypt_many([row[1] for row in rows])
+
+        keyword = value.lower()
+        matched_ids = [
+            row[0]
+            for row, dec_value in zip(rows, dec_values)
+            if dec_value and keyword in dec_value.lower()
+        ]
+
+    except Exception as e:
+        logger.warning(f"[search_contains] {to_str(e)}")
+        raise
+
+    return queryset.filter(id__in=matched_ids)
+
+
+class MatchAgainst(Func):
+    """
+    MySQL FULLTEXT 검색 식 : MATCH (필드) AGAINST (검색어 IN BOOLEAN MODE)
+    조건(WHERE)에 사용하면 FULLTEXT 인덱스로 조회하고, 값으로 사용하면 관련도 점수를 반환
+    """
+
+    def __init__(self, expression, query, output_field=None):
+        super().__init__(expression, Value(query), output_field=output_field or FloatField())
+
+    def as_sql(self, compiler, connection, **extra_context):
+        field_sql, field_params = compiler.compile(self.source_expressions[0])
+        query_sql, query_params = compiler.compile(self.source_expressions[1])
+
+        return f"MATCH ({field_sql}) AGAINST ({query_sql} IN BOOLEAN MODE)", (*field_params, *query_params)
+
+
+# 단어 별 구문 검색어(+"단어")를 모두 포함하는 BOOLEAN MODE 검색어 생성
+def make_fulltext_query(value):
+    words = [word.replace('"', "") for word in value.split()]
+
+    return " ".join(f'+"{word}"' for word in words if word)
+
+
+# 감사 로그 전문 검색 사본 및 n-gram 역색인 기록 (MySQL은 audit_log INSERT 트리거로 기록)
+def index_audit_logs(logs):
+    if connection.vendor == "mysql":
+        return
+
+    logs = [log for log in logs if log.id is not None]
+
+    models.AuditLogSearch.objects.bulk_create(
+        [models.AuditLogSearch(log_id=log.id, action=log.action, date=log.date) for log in logs],
+        batch_size=500,
+    )
+    models.AuditLogSearchToken.objects.bulk_create(
+        [
+            models.AuditLogSearchToken(log_id=log.id, token=token)
+            for log in logs
+            for token in make_ngrams(log.action)
+        ],
+        batch_size=1000,
+    )
+
+
+# 감사 로그 내용 전문 검색 : 일치하는 로그만 조회하며 관련도(relevance)를 함께 반환 (결과가 없어도 관련도 정렬 가능)
+def search_audit_log(queryset, value):
+    if connection.vendor == "mysql":
+        query = make_fulltext_query(value)
+        if not query:
+            return queryset.annotate(relevance=Value(0.0, output_field=FloatField())).none()
+
+        # 검색 사본 테이블을 INNER JOIN 하여 FULLTEXT 인덱스로 먼저 조회
+        return queryset.filter(
+            MatchAgainst(F("search__action"), query, output_field=BooleanField()),
+            search__isnull=False,
+        ).annotate(relevance=MatchAgainst(F("search__action"), query))
+
+    # FULLTEXT 인덱스를 지원하지 않는 DB : n-gram 역색인으로 후보를 조회한 뒤 단어 포함 여부 확인
+    words = value.lower().split()
+    tokens = make_ngrams(value)
+    if not tokens:
+        return queryset.annotate(relevance=Value(0.0, output_field=FloatField())).none()
+
+    try:
+        candidate_ids = (
+            models.AuditLogSearchToken.objects.filter(token__in=tokens)
+            .values("log_id")
+            .annotate(matched=Count("token", distinct=True))
+            .filter(matched=len(tokens))
+            .values_list("log_id", flat=True)
+        )
+
+        # 관련도 : 검색어 단어의 등장 횟수 합계
+        scores = {}
+        for log_id, action in models.AuditLogSearch.objects.filter(
+            log_id__in=candidate_ids
+        ).values_list("log_id", "action"):
+            text = action.lower()
+            if all(word in text for word in words):
+                scores[log_id] = float(sum(text.count(word) for word in words))
+
+    except Exception as e:
+        logger.warning(f"[search_audit_log] {to_str(e)}")
+        raise
+
+    if not scores:
+        return queryset.annotate(relevance=Value(0.0, output_field=FloatField())).none()
+
+    return queryset.filter(id__in=list(scores)).annotate(
+        relevance=Case(
+            *[When(id=log_id, then=Value(score)) for log_id, score in scores.items()],
+            output_field=FloatField(),
+        )
+    )
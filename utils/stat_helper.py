@@ -0,0 +1,55 @@
+import logging
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from api import models
+
+logger = logging.getLogger(__name__)
+
+
+# 사용자의 항목 건수를 직접 계산 : {건수 필드: 건수}
+def count_user_stat(user_id):
+    return {
+        field: model.objects.filter(user_id=user_id).count()
+        for model, field in models.USER_STAT_FIELDS.items()
+    }
+
+
+# 사용자 통계 생성 (동시에 생성된 경우 먼저 생성된 통계 반환)
+def create_user_stat(user_id):
+    try:
+        with transaction.atomic():
+            return models.UserStat.objects.create(user_id=user_id, **count_user_stat(user_id))
+
+    except IntegrityError:
+        return models.UserStat.objects.get(user_id=user_id)
+
+
+# 사용자 통계 조회 (없는 경우 현재 건수로 생성)
+def get_user_stat(user_id):
+    user_stat = models.UserStat.objects.filter(user_id=user_id).first()
+    if user_stat is None:
+        user_stat = create_user_stat(user_id)
+
+    return user_stat
+
+
+# 항목 추가(1)/삭제(-1) 후 같은 트랜잭션에서 사용자 통계 증감
+def update_user_stat(instance, amount):
+    if instance.user_id is None:
+        return
+
+    field = models.USER_STAT_FIELDS[type(instance)]
+    user_stats = models.UserStat.objects.filter(user_id=instance.user_id)
+    if user_stats.update(**{field: F(field) + amount}):
+        return
+
+    # 통계가 없는 경우 현재 건수(추가/삭제 반영 후)로 생성
+    try:
+        with transaction.atomic():
+            models.UserStat.objects.create(user_id=instance.user_id, **count_user_stat(instance.user_id))
+
+    except IntegrityError:
+        # 동시에 생성된 통계에는 이 트랜잭션의 추가/삭제가 반영되지 않았으므로 증감 적용
+        user_stats.update(**{field: F(field) + amount})